@@ -1,6 +1,5 @@
 """FxFixParser CLI - Parse FIX messages from the command line."""
 
-import json
 import os
 import re
 import sys
@@ -49,7 +48,7 @@ def parse_and_display(raw_message: str, output_format: str, venue_name: str | No
 
         # Output based on format
         if output_format == "json":
-            print(json.dumps(message.to_dict(), indent=2))
+            print(message.to_json(indent=True))
         elif output_format == "table":
             print_table(message)
         else:
@@ -1,35 +1,76 @@
 """FIX field data models."""
 
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable, cast
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FixFieldDefinition:
-    """Definition of a FIX field from the data dictionary."""
+    """Definition of a FIX field from the data dictionary.
+
+    Definitions are shared by every dictionary and parsed field that uses
+    them, so they are immutable; build a new one to change a definition.
+    """
 
     tag: int
     name: str
     field_type: str = "STRING"
     description: str = ""
-    valid_values: dict[str, str] = field(default_factory=dict)
+    valid_values: dict[str, str] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        # Names and types repeat across every dictionary and parsed field;
+        # interning lets equality checks on them short-circuit on identity.
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "field_type", sys.intern(self.field_type))
 
     def get_value_description(self, value: str) -> str | None:
         """Get the description for an enumerated value."""
         return self.valid_values.get(value)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class FixField:
-    """A parsed FIX field with its value and definition."""
+    """A parsed FIX field with its value and definition.
+
+    Fields are immutable. Two fields are equal when they carry the same tag
+    and raw value; the definition is how the value is interpreted, not part
+    of the value itself.
+    """
 
     tag: int
     raw_value: str
     definition: FixFieldDefinition | None = None
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FixField):
+            return NotImplemented
+        # Compare tags first: most mismatches differ by tag.
+        return self.tag == other.tag and self.raw_value == other.raw_value
+
+    def __hash__(self) -> int:
+        return hash((self.tag, self.raw_value))
+
+    @classmethod
+    def fast(
+        cls, tag: int, raw_value: str, definition: FixFieldDefinition | None = None
+    ) -> "FixField":
+        """Build a field without going through the dataclass ``__init__``.
+
+        Equivalent to ``FixField(tag, raw_value, definition)`` but writes the
+        slots directly, which roughly halves construction cost. Meant for the
+        parser's per-field loop; arguments are not checked.
+        """
+        obj = _new(cls)
+        _set_tag(obj, tag)
+        _set_raw_value(obj, raw_value)
+        _set_definition(obj, definition)
+        return obj
+
     @property
     def name(self) -> str:
         """Get the field name from the definition, or 'Unknown' if not defined."""
@@ -47,9 +88,10 @@ class FixField:
     @property
     def value_description(self) -> str | None:
         """Get the description for the current value if it's an enumerated type."""
-        if self.definition:
-            return self.definition.get_value_description(self.raw_value)
-        return None
+        definition = self.definition
+        if definition is None:
+            return None
+        return definition.get_value_description(self.raw_value)
 
     @property
     def typed_value(self) -> Any:
@@ -90,20 +132,46 @@ class FixField:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the field to a dictionary representation."""
-        result: dict[str, Any] = {
-            "tag": self.tag,
-            "name": self.name,
-            "value": self.raw_value,
-        }
-        if self.value_description:
-            result["value_description"] = self.value_description
-        if self.description:
-            result["field_description"] = self.description
-        return result
+        return fields_to_dicts((self,))[0]
 
     def __str__(self) -> str:
         """Return a human-readable string representation."""
-        value_desc = self.value_description
+        definition = self.definition
+        if definition is None:
+            return f"{self.name} ({self.tag}): {self.raw_value}"
+        value_desc = definition.get_value_description(self.raw_value)
         if value_desc:
-            return f"{self.name} ({self.tag}): {self.raw_value} ({value_desc})"
-        return f"{self.name} ({self.tag}): {self.raw_value}"
+            return f"{definition.name} ({self.tag}): {self.raw_value} ({value_desc})"
+        return f"{definition.name} ({self.tag}): {self.raw_value}"
+
+
+# Slot descriptors' setters bypass the frozen-dataclass __setattr__ guard.
+_new = object.__new__
+_set_tag = cast(Any, FixField.__dict__["tag"]).__set__
+_set_raw_value = cast(Any, FixField.__dict__["raw_value"]).__set__
+_set_definition = cast(Any, FixField.__dict__["definition"]).__set__
+
+
+def fields_to_dicts(fields: Iterable[FixField]) -> list[dict[str, Any]]:
+    """Convert fields to their dictionary representations in one pass.
+
+    Produces the same dicts as :meth:`FixField.to_dict`, but reads each
+    field's definition once instead of going through the ``name``,
+    ``value_description`` and ``description`` properties, which matters when
+    serializing every field of a message.
+    """
+    result: list[dict[str, Any]] = []
+    append = result.append
+    for f in fields:
+        definition = f.definition
+        if definition is None:
+            append({"tag": f.tag, "name": f.name, "value": f.raw_value})
+            continue
+        item: dict[str, Any] = {"tag": f.tag, "name": definition.name, "value": f.raw_value}
+        value_description = definition.get_value_description(f.raw_value)
+        if value_description:
+            item["value_description"] = value_description
+        if definition.description:
+            item["field_description"] = definition.description
+        append(item)
+    return result
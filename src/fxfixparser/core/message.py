@@ -1,16 +1,67 @@
 """FIX message data models."""
 
+import json
 import logging
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Iterator
+from typing import AbstractSet, Any, Iterator, Sequence
 
-from fxfixparser.core.field import FixField
+from fxfixparser.core.field import FixField, fields_to_dicts
 from fxfixparser.tags.repeating_groups import get_group_definition
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _split_group_entries(
+    tags: Sequence[int],
+    start: int,
+    count: int,
+    member_tags: AbstractSet[int],
+    nested_member_tags: AbstractSet[int],
+) -> tuple["array[int]", int]:
+    """Find the entry boundaries of a repeating group.
+
+    Scans ``tags`` from ``start`` (the index just after the count tag) over
+    consecutive member tags. A member tag already seen in the current entry
+    starts a new one, except for tags of a flattened nested subgroup, which
+    legitimately repeat within one parent entry. Scanning stops at the first
+    non-member tag or once ``count`` entries have been opened.
+
+    Works on tag numbers only so it stays a tight integer loop; the caller
+    slices the field list with the returned offsets.
+
+    Returns:
+        A tuple of (entry start offsets, end index). The first offset is
+        always ``start``; the group holds no entries when the end index
+        equals ``start``.
+    """
+    boundaries = array("i", [start])
+    if count < 1:
+        return boundaries, start
+
+    # One set reused for every entry: clearing it is cheaper than
+    # allocating a fresh one at each boundary.
+    seen_tags: set[int] = set()
+    mark_seen = seen_tags.add
+
+    for i in range(start, len(tags)):
+        tag = tags[i]
+        if tag not in member_tags:
+            # Not a member tag - end of group entries
+            return boundaries, i
+        if tag in seen_tags and tag not in nested_member_tags:
+            boundaries.append(i)
+            if len(boundaries) > count:
+                # Declared count exhausted. The field that opened this extra
+                # entry is still consumed by it.
+                return boundaries, i + 1
+            seen_tags.clear()
+        mark_seen(tag)
+
+    return boundaries, len(tags)
+
+
+@dataclass(slots=True)
 class RepeatingGroupEntry:
     """A single entry within a repeating group."""
 
@@ -21,23 +72,24 @@ class RepeatingGroupEntry:
         """Convert the entry to a dictionary representation."""
         return {
             "index": self.index,
-            "fields": [f.to_dict() for f in self.fields],
+            "fields": fields_to_dicts(self.fields),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RepeatingGroup:
     """A repeating group with its count field and entries."""
 
     name: str
     count_field: FixField
     entries: list[RepeatingGroupEntry] = field(default_factory=list)
+    # Declared number of entries, parsed once from count_field (0 when the
+    # count is not numeric).
+    count: int = field(init=False, compare=False)
 
-    @property
-    def count(self) -> int:
-        """Get the declared number of entries in this group."""
+    def __post_init__(self) -> None:
         try:
-            return int(self.count_field.raw_value)
+            self.count = int(self.count_field.raw_value)
         except ValueError:
             logger.warning(
                 "Non-numeric group count for %s (tag %d): '%s'",
@@ -45,7 +97,7 @@ class RepeatingGroup:
                 self.count_field.tag,
                 self.count_field.raw_value,
             )
-            return 0
+            self.count = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the group to a dictionary representation."""
@@ -83,13 +135,50 @@ class FixMessage:
     # True when the input was a pretty-printed parsed report that was
     # reconstructed into a raw stream (see core/report_format.py).
     converted_from_report: bool = False
+    # Tag numbers of ``fields`` stored as a compact int array parallel to the
+    # field list, so scans over tags (group splitting) touch plain ints
+    # instead of loading an attribute from every FixField object.
+    _tags: Sequence[int] = field(default=(), init=False, repr=False, compare=False)
+    # Memoized get_structured_fields() result.
+    _structured_cache: list[StructuredField] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # First field for each tag, built on the first get_field() call.
+    _by_tag: dict[int, FixField] | None = field(default=None, init=False, repr=False, compare=False)
+    # The list object and its length when the indexes above were built.
+    # Replacing ``fields`` or growing/shrinking it marks them stale; an
+    # in-place item assignment does not, so reassign ``fields`` for that.
+    _indexed_fields: list[FixField] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_len: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _sync_index(self) -> None:
+        """Rebuild the tag array and drop derived caches if ``fields`` changed."""
+        fields = self.fields
+        if fields is self._indexed_fields and len(fields) == self._indexed_len:
+            return
+        tags = [f.tag for f in fields]
+        try:
+            self._tags = array("i", tags)
+        except OverflowError:
+            # Malformed input can carry tag numbers beyond a C int; keep a
+            # plain list so such messages still parse.
+            self._tags = tags
+        self._structured_cache = None
+        self._by_tag = None
+        self._indexed_fields = fields
+        self._indexed_len = len(fields)
 
     def get_field(self, tag: int) -> FixField | None:
         """Get the first field with the given tag number."""
-        for f in self.fields:
-            if f.tag == tag:
-                return f
-        return None
+        fields = self.fields
+        by_tag = self._by_tag
+        if by_tag is None or fields is not self._indexed_fields or len(fields) != self._indexed_len:
+            self._sync_index()
+            # Built in reverse so the first field for a repeated tag wins.
+            by_tag = self._by_tag = {f.tag: f for f in reversed(fields)}
+        return by_tag.get(tag)
 
     def get_fields(self, tag: int) -> list[FixField]:
         """Get all fields with the given tag number."""
@@ -154,80 +243,54 @@ class FixMessage:
         seen in the current entry appears again, indicating the start of a
         new entry.
 
+        The result is computed once and cached until ``fields`` is replaced
+        or changes length; treat it as read-only.
+
         Returns:
             A list of StructuredField objects, where each may be either a
             standalone field or a repeating group containing multiple entries.
         """
+        self._sync_index()
+        if self._structured_cache is not None:
+            return self._structured_cache
+
         result: list[StructuredField] = []
+        fields = self.fields
+        tags = self._tags
+        n = len(tags)
         i = 0
 
-        while i < len(self.fields):
-            current_field = self.fields[i]
-            group_def = get_group_definition(current_field.tag)
+        while i < n:
+            current_field = fields[i]
+            group_def = get_group_definition(tags[i])
 
             if group_def is not None:
                 # This is a repeating group count tag
-                try:
-                    count = int(current_field.raw_value)
-                except ValueError:
-                    logger.warning(
-                        "Non-numeric group count for tag %d: '%s'",
-                        current_field.tag,
-                        current_field.raw_value,
-                    )
-                    count = 0
-
                 group = RepeatingGroup(
                     name=group_def.name,
                     count_field=current_field,
                     entries=[],
                 )
+                count = group.count
 
                 # Collect group entries
-                i += 1
-                entry_index = 1
-                current_entry: list[FixField] = []
-                seen_tags: set[int] = set()
-
-                while i < len(self.fields) and entry_index <= count:
-                    fld = self.fields[i]
-
-                    if fld.tag in group_def.member_tags:
-                        # Detect entry boundary: if we've already seen this
-                        # tag in the current entry, it marks a new entry.
-                        # Tags belonging to a flattened nested subgroup are
-                        # exempt — they repeat within one parent entry.
-                        if (
-                            current_entry
-                            and fld.tag in seen_tags
-                            and fld.tag not in group_def.nested_member_tags
-                        ):
-                            # Save previous entry and start new one
-                            group.entries.append(
-                                RepeatingGroupEntry(
-                                    index=entry_index,
-                                    fields=current_entry,
-                                )
-                            )
-                            entry_index += 1
-                            current_entry = [fld]
-                            seen_tags = {fld.tag}
-                        else:
-                            current_entry.append(fld)
-                            seen_tags.add(fld.tag)
-                        i += 1
-                    else:
-                        # Not a member tag - end of group entries
-                        break
-
-                # Save last entry
-                if current_entry:
-                    group.entries.append(
-                        RepeatingGroupEntry(
-                            index=entry_index,
-                            fields=current_entry,
+                boundaries, end = _split_group_entries(
+                    tags,
+                    i + 1,
+                    count,
+                    group_def.member_tags,
+                    group_def.nested_member_tags,
+                )
+                if end > i + 1:
+                    # Second pass: build every entry from the offsets at once.
+                    boundaries.append(end)
+                    group.entries = [
+                        RepeatingGroupEntry(index=j + 1, fields=fields[entry_start:entry_end])
+                        for j, (entry_start, entry_end) in enumerate(
+                            zip(boundaries, boundaries[1:])
                         )
-                    )
+                    ]
+                i = end
 
                 # Validate actual vs declared count
                 actual_count = len(group.entries)
@@ -246,6 +309,7 @@ class FixMessage:
                 result.append(StructuredField(field=current_field))
                 i += 1
 
+        self._structured_cache = result
         return result
 
     def to_dict(self, structured: bool = True) -> dict[str, Any]:
@@ -279,10 +343,28 @@ class FixMessage:
                     fields_list.append(sf.field.to_dict())
             base["fields"] = fields_list
         else:
-            base["fields"] = [f.to_dict() for f in self.fields]
+            base["fields"] = fields_to_dicts(self.fields)
 
         return base
 
+    def to_json(self, structured: bool = True, indent: bool = False) -> str:
+        """Serialize the message's :meth:`to_dict` representation to JSON.
+
+        Non-ASCII text is escaped, so the output is safe to print on any
+        console encoding.
+
+        Args:
+            structured: Passed through to :meth:`to_dict`.
+            indent: If True, pretty-print with two-space indentation.
+
+        Returns:
+            The JSON document as a string.
+        """
+        data = self.to_dict(structured=structured)
+        if indent:
+            return json.dumps(data, indent=2)
+        return json.dumps(data, separators=(",", ":"))
+
     def to_human_readable(self, structured: bool = True) -> str:
         """Convert the message to a human-readable string.
 
@@ -315,14 +397,12 @@ class FixMessage:
                     lines.append("=" * 40)
                     for entry in group.entries:
                         lines.append(f"  [Entry {entry.index}]")
-                        for f in entry.fields:
-                            lines.append(f"    {f}")
+                        lines.extend([f"    {f}" for f in entry.fields])
                     lines.append("")
                 elif sf.field:
                     lines.append(str(sf.field))
         else:
-            for f in self.fields:
-                lines.append(str(f))
+            lines.extend(map(str, self.fields))
 
         return "\n".join(lines)
 
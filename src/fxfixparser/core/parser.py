@@ -19,6 +19,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Tokenizer patterns, compiled once. In strict delimiter mode SOH must follow
+# every field; otherwise it may be missing after the last one.
+_STRICT_FIELD_RE = re.compile(r"(\d+)=([^\x01]*)\x01")
+_LENIENT_FIELD_RE = re.compile(r"(\d+)=([^\x01]*)\x01?")
+# A line break directly before a "tag=" marks a field boundary.
+_FIELD_LINE_BREAK_RE = re.compile(r"(\r\n|\r|\n)(?=\d+=)")
+
+
+class _TagNumberCache(dict[str, int | None]):
+    """Memo of tag string -> int for the tokenizer.
+
+    A message reuses a small set of tags, so a dict hit replaces most int()
+    conversions. Misses fall through to int(); growth is capped so odd input
+    (e.g. zero-padded tags) can't grow the cache without bound. Tags int()
+    rejects map to None (not cached) so the caller can skip the field.
+    """
+
+    _MAX_SIZE = 4096
+
+    def __missing__(self, tag_str: str) -> int | None:
+        try:
+            tag = int(tag_str)
+        except ValueError:
+            # Digit strings past sys.get_int_max_str_digits() (4300 by
+            # default) are refused by int().
+            logger.debug("Skipping field with unparseable tag: '%.20s...'", tag_str)
+            return None
+        if len(self) < self._MAX_SIZE:
+            self[tag_str] = tag
+        return tag
+
+
+_TAG_NUMBERS = _TagNumberCache()
+
 
 @dataclass
 class ParserConfig:
@@ -37,6 +71,10 @@ class FixParser:
     SOH = "\x01"
     PIPE = "|"
 
+    # str.translate tables for _normalize_delimiter.
+    _LINE_BREAKS: dict[int, int | None] = str.maketrans("", "", "\r\n")
+    _LINE_BREAKS_AND_PIPES: dict[int, int | None] = str.maketrans(PIPE, SOH, "\r\n")
+
     # Cache of dictionaries layered with a FIX version spec, keyed by
     # (id(base_dictionary), appl_ver_id). Kept at class level so repeated
     # parses across parser instances share the merge cost.
@@ -187,10 +225,7 @@ class FixParser:
             return self.dictionary
 
         merged = TagDictionary()
-        for tag in self.dictionary.all_tags():
-            defn = self.dictionary.get(tag)
-            if defn:
-                merged.add(defn)
+        merged.merge(self.dictionary)
         # For tags the base doesn't define, add the spec entry as-is.
         # For tags both define, keep the base's name/type/description
         # (curated for FX) but layer in any enum values the spec contributes
@@ -237,10 +272,7 @@ class FixParser:
 
         # Create a copy of the base dictionary and merge venue tags
         venue_dict = TagDictionary()
-        for tag in base.all_tags():
-            defn = base.get(tag)
-            if defn:
-                venue_dict.add(defn)
+        venue_dict.merge(base)
         # Then add/override with venue-specific tag definitions
         for defn in venue_handler.custom_tags:
             venue_dict.add(defn)
@@ -283,15 +315,18 @@ class FixParser:
         before a new tag=value pair), they are replaced with SOH to preserve
         field boundaries.
         """
+        allow_pipe = self.config.allow_pipe_delimiter
+        if "\n" not in message and "\r" not in message:
+            # Common case: a single-line message needs at most the pipe swap.
+            return message.replace(self.PIPE, self.SOH) if allow_pipe else message
+
         # Replace line breaks that appear between fields (i.e. right
         # before a "tag=" pattern) with SOH to preserve field boundaries.
-        message = re.sub(r"(\r\n|\r|\n)(?=\d+=)", self.SOH, message)
+        message = _FIELD_LINE_BREAK_RE.sub(self.SOH, message)
         # Strip remaining line breaks that are mid-value line wrapping
-        # so that split values are reassembled correctly.
-        message = message.replace("\r\n", "").replace("\r", "").replace("\n", "")
-        if self.config.allow_pipe_delimiter and self.PIPE in message:
-            return message.replace(self.PIPE, self.SOH)
-        return message
+        # so that split values are reassembled correctly, and swap pipes
+        # for SOH in the same pass.
+        return message.translate(self._LINE_BREAKS_AND_PIPES if allow_pipe else self._LINE_BREAKS)
 
     def _extract_fields(self, message: str) -> list[tuple[int, str]]:
         """Extract tag=value pairs from the message.
@@ -300,34 +335,21 @@ class FixParser:
         In non-strict mode (default), SOH is optional after the last field
         to be lenient with messages that omit the trailing delimiter.
         """
-        if self.config.strict_delimiter:
-            # Require SOH after every field (mandatory delimiter)
-            pattern = r"(\d+)=([^" + self.SOH + r"]*)" + self.SOH
-        else:
-            # Allow optional trailing SOH (lenient for last field)
-            pattern = r"(\d+)=([^" + self.SOH + r"]*)" + self.SOH + r"?"
-        matches = re.findall(pattern, message)
-
-        fields: list[tuple[int, str]] = []
-        for tag_str, value in matches:
-            try:
-                tag = int(tag_str)
-                fields.append((tag, value))
-            except ValueError:
-                logger.debug("Skipping field with non-numeric tag: '%s'", tag_str)
-                continue
-
-        return fields
+        pattern = _STRICT_FIELD_RE if self.config.strict_delimiter else _LENIENT_FIELD_RE
+        tag_numbers = _TAG_NUMBERS
+        return [
+            (tag, value)
+            for tag_str, value in pattern.findall(message)
+            if (tag := tag_numbers[tag_str]) is not None
+        ]
 
     def _build_fields(
         self, raw_fields: list[tuple[int, str]], dictionary: TagDictionary
     ) -> list[FixField]:
         """Build FixField objects with definitions from the dictionary."""
-        fields: list[FixField] = []
-        for tag, value in raw_fields:
-            definition = dictionary.get(tag)
-            fields.append(FixField(tag=tag, raw_value=value, definition=definition))
-        return fields
+        get_definition = dictionary.get
+        make_field = FixField.fast
+        return [make_field(tag, value, get_definition(tag)) for tag, value in raw_fields]
 
     def _validate_structure(
         self, message: FixMessage, normalized: str, *, strict: bool = True
@@ -445,5 +467,10 @@ class FixParser:
     @staticmethod
     def calculate_checksum(message: str) -> str:
         """Calculate the FIX checksum for a message body."""
-        total = sum(ord(c) for c in message)
+        try:
+            # FIX text is single-byte, so summing the encoded bytes runs in C
+            # and matches summing code points.
+            total = sum(message.encode("latin-1"))
+        except UnicodeEncodeError:
+            total = sum(map(ord, message))
         return f"{total % 256:03d}"
@@ -5,12 +5,23 @@ FixFieldDefinition objects for use in the tag dictionary.
 Supports any QuickFIX XML (FIX44.xml, FIX50SP2.xml, etc.).
 """
 
+from __future__ import annotations
+
+import functools
+import hashlib
 import logging
-import xml.etree.ElementTree as ET
+import os
+import pickle
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from fxfixparser.core import field as field_module
 from fxfixparser.core.field import FixFieldDefinition
 
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
 logger = logging.getLogger(__name__)
 
 _SPEC_DIR = Path(__file__).parent
@@ -26,12 +37,120 @@ _APPL_VER_ID_TO_SPEC: dict[str, str] = {
 # Parsed-spec cache so repeated parses don't re-read the XML.
 _APPL_VER_ID_CACHE: dict[str, list[FixFieldDefinition]] = {}
 
+# Parsed definitions are also pickled into a per-user cache directory so a
+# fresh interpreter can skip the XML parse. Nothing is ever written into the
+# package itself. Set FXFIXPARSER_CACHE_DIR to move the cache.
+_CACHE_DIR_ENV = "FXFIXPARSER_CACHE_DIR"
+_CACHE_KEY_LENGTH = 32
+
+
+def _cache_dir() -> Path:
+    """Return the directory holding pickled spec definitions.
+
+    ``$FXFIXPARSER_CACHE_DIR`` when set, otherwise an ``fxfixparser``
+    folder in the platform's user cache location.
+    """
+    override = os.environ.get(_CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        base = Path(os.environ["LOCALAPPDATA"])
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "fxfixparser"
+
+
+@functools.lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Hash the code that determines what a cached pickle contains.
+
+    Covers this loader, the FixFieldDefinition module and the Python
+    version, so pickles written by any other version of either are never
+    read back.
+    """
+    digest = hashlib.sha256(repr(sys.version_info[:2]).encode())
+    for source in (__file__, field_module.__file__):
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def _pickle_cache_path(xml_path: Path) -> Path:
+    """Return the pickle cache path for the current state of ``xml_path``.
+
+    The name is keyed on the code fingerprint and on the XML's location,
+    size and modification time, so editing either gives a new path rather
+    than a stale hit.
+    """
+    stat = xml_path.stat()
+    key = hashlib.sha256(
+        f"{_code_fingerprint()}|{xml_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}".encode()
+    ).hexdigest()[:_CACHE_KEY_LENGTH]
+    return _cache_dir() / f"{xml_path.stem}-{key}.pkl"
+
+
+def _read_pickle_cache(xml_path: Path) -> list[FixFieldDefinition] | None:
+    """Return cached definitions for ``xml_path``, or None if there are none."""
+    try:
+        definitions = pickle.loads(_pickle_cache_path(xml_path).read_bytes())  # noqa: S301
+    except Exception:  # missing or unreadable
+        return None
+    # Unpickling bypasses __post_init__ and yields fresh string copies, so
+    # restore the sharing that a parse from XML would have given.
+    for definition in definitions:
+        _reintern(definition)
+    return list(definitions)
+
+
+def _reintern(definition: FixFieldDefinition) -> None:
+    """Intern an unpickled definition's name, type and enum strings in place.
+
+    The definition is freshly unpickled and not yet shared, so writing its
+    frozen slots here is safe (``__post_init__`` does the same).
+    """
+    intern = sys.intern
+    object.__setattr__(definition, "name", intern(definition.name))
+    object.__setattr__(definition, "field_type", intern(definition.field_type))
+    if definition.valid_values:
+        object.__setattr__(
+            definition,
+            "valid_values",
+            {intern(code): intern(text) for code, text in definition.valid_values.items()},
+        )
+
+
+def _write_pickle_cache(xml_path: Path, definitions: list[FixFieldDefinition]) -> None:
+    """Best-effort write of the pickle cache; unwritable cache dirs just skip it."""
+    try:
+        cache_path = _pickle_cache_path(xml_path)
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file.
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(definitions, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("Could not write spec cache for %s: %s", xml_path, exc)
+        return
+
+    # Every upgrade or XML edit keys a new file; drop the older ones for this
+    # spec so the cache directory does not grow without bound.
+    for old_path in cache_path.parent.glob(f"{xml_path.stem}-{'?' * _CACHE_KEY_LENGTH}.pkl"):
+        if old_path != cache_path:
+            try:
+                old_path.unlink()
+            except OSError as exc:
+                logger.debug("Could not remove old spec cache %s: %s", old_path, exc)
+
 
 def load_fix_spec_fields(xml_path: Path) -> list[FixFieldDefinition]:
     """Load field definitions from any QuickFIX-format XML specification.
 
     Parses a QuickFIX XML file with the standard ``<fix><fields><field>``
     structure and returns a list of :class:`FixFieldDefinition` objects.
+    Results are memoized per path, and pickled into a per-user cache
+    directory so a new process can skip re-parsing it; editing the XML or
+    upgrading the package starts a fresh cache entry.
 
     Args:
         xml_path: Path to the QuickFIX XML specification file.
@@ -41,53 +160,100 @@ def load_fix_spec_fields(xml_path: Path) -> list[FixFieldDefinition]:
         Returns an empty list if the file does not exist or contains no
         ``<fields>`` element.
     """
-    if not xml_path.exists():
+    if not xml_path.is_file():
         logger.warning("Spec XML not found at %s, returning empty list", xml_path)
         return []
 
-    tree = ET.parse(xml_path)  # noqa: S314
-    root = tree.getroot()
+    # Copy so callers can't mutate the memoized result.
+    return list(_load_spec_fields_cached(xml_path))
 
-    fields_elem = root.find("fields")
-    if fields_elem is None:
-        logger.warning("No <fields> element found in %s", xml_path)
-        return []
+
+@functools.lru_cache(maxsize=4)
+def _load_spec_fields_cached(xml_path: Path) -> tuple[FixFieldDefinition, ...]:
+    """Load and memoize definitions, preferring the on-disk pickle cache."""
+    definitions = _read_pickle_cache(xml_path)
+    if definitions is None:
+        definitions = _parse_spec_xml(xml_path)
+        if definitions:
+            _write_pickle_cache(xml_path, definitions)
+    return tuple(definitions)
+
+
+def _parse_spec_xml(xml_path: Path) -> list[FixFieldDefinition]:
+    """Parse field definitions out of a QuickFIX-format XML file.
+
+    The file is streamed with ``iterparse`` and each top-level section is
+    cleared once read, so the (large) message and component trees are never
+    held in memory alongside the field definitions.
+    """
+    # Imported here so a missing spec, or a warm pickle cache, never pays
+    # for loading the XML parser.
+    import xml.etree.ElementTree as ET
 
     definitions: list[FixFieldDefinition] = []
-    for field_elem in fields_elem.findall("field"):
-        tag_str = field_elem.get("number")
-        name = field_elem.get("name")
-        field_type = field_elem.get("type", "STRING")
+    depth = 0
+    in_fields = False
+    seen_fields = False
 
-        if not tag_str or not name:
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):  # noqa: S314
+        if event == "start":
+            depth += 1
+            # Only the first top-level <fields> section holds definitions;
+            # <field> elements elsewhere are references by name.
+            if depth == 2 and elem.tag == "fields" and not seen_fields:
+                in_fields = seen_fields = True
             continue
 
-        try:
-            tag = int(tag_str)
-        except ValueError:
-            continue
+        depth -= 1
+        if in_fields and depth == 2 and elem.tag == "field":
+            definition = _field_definition_from_element(elem)
+            if definition is not None:
+                definitions.append(definition)
+            elem.clear()
+        elif depth == 1:
+            # End of a top-level section (header, messages, fields, ...)
+            in_fields = False
+            elem.clear()
 
-        # Parse enumerated values
-        valid_values: dict[str, str] = {}
-        for value_elem in field_elem.findall("value"):
-            enum_val = value_elem.get("enum")
-            description = value_elem.get("description", "")
-            if enum_val is not None:
-                valid_values[enum_val] = description
-
-        definitions.append(
-            FixFieldDefinition(
-                tag=tag,
-                name=name,
-                field_type=field_type,
-                valid_values=valid_values,
-            )
-        )
+    if not seen_fields:
+        logger.warning("No <fields> element found in %s", xml_path)
+        return []
 
     logger.info("Loaded %d field definitions from %s", len(definitions), xml_path)
     return definitions
 
 
+def _field_definition_from_element(field_elem: ET.Element) -> FixFieldDefinition | None:
+    """Build a definition from a ``<field>`` element, or None if malformed."""
+    tag_str = field_elem.get("number")
+    name = field_elem.get("name")
+    field_type = field_elem.get("type", "STRING")
+
+    if not tag_str or not name:
+        return None
+
+    try:
+        tag = int(tag_str)
+    except ValueError:
+        return None
+
+    # Parse enumerated values. Codes and descriptions ("Y", "BUY", ...)
+    # repeat across many fields, so share one copy of each.
+    valid_values: dict[str, str] = {}
+    for value_elem in field_elem.findall("value"):
+        enum_val = value_elem.get("enum")
+        description = value_elem.get("description", "")
+        if enum_val is not None:
+            valid_values[sys.intern(enum_val)] = sys.intern(description)
+
+    return FixFieldDefinition(
+        tag=tag,
+        name=name,
+        field_type=field_type,
+        valid_values=valid_values,
+    )
+
+
 def load_spec_for_appl_ver_id(appl_ver_id: str) -> list[FixFieldDefinition]:
     """Return field definitions for the bundled spec matching ``appl_ver_id``.
 
@@ -1,11 +1,13 @@
 """FIX tag dictionary and definitions."""
 
 from fxfixparser.tags.dictionary import TagDictionary
-from fxfixparser.tags.fix44 import FIX44_TAGS
-from fxfixparser.tags.fx_tags import FX_CUSTOM_TAGS
+from fxfixparser.tags.fix44 import FIX44_TAGS, FIX44_TAGS_BY_NUMBER
+from fxfixparser.tags.fx_tags import FX_CUSTOM_TAGS, FX_CUSTOM_TAGS_BY_NUMBER
 
 __all__ = [
     "TagDictionary",
     "FIX44_TAGS",
+    "FIX44_TAGS_BY_NUMBER",
     "FX_CUSTOM_TAGS",
+    "FX_CUSTOM_TAGS_BY_NUMBER",
 ]
@@ -1,6 +1,8 @@
 """Tag dictionary manager for FIX field definitions."""
 
 import logging
+from itertools import chain
+from typing import Iterable
 
 from fxfixparser.core.field import FixFieldDefinition
 
@@ -14,10 +16,20 @@ class TagDictionary:
 
     def __init__(self) -> None:
         self._tags: dict[int, FixFieldDefinition] = {}
+        # Tag -> name, kept in step with _tags so get_name is one lookup.
+        self._names: dict[int, str] = {}
+        # Snapshot returned by all_tags(); rebuilt lazily after a change.
+        self._all_tags_cache: frozenset[int] | None = None
+
+    def __contains__(self, tag: object) -> bool:
+        """Check if a tag is defined in the dictionary."""
+        return tag in self._tags
 
     def add(self, definition: FixFieldDefinition) -> None:
         """Add a field definition to the dictionary."""
         self._tags[definition.tag] = definition
+        self._names[definition.tag] = definition.name
+        self._all_tags_cache = None
 
     def get(self, tag: int) -> FixFieldDefinition | None:
         """Get the definition for a tag number."""
@@ -25,23 +37,45 @@ class TagDictionary:
 
     def get_name(self, tag: int) -> str:
         """Get the name for a tag number, or 'Unknown' if not defined."""
-        definition = self.get(tag)
-        if definition:
-            return definition.name
+        name = self._names.get(tag)
+        if name is not None:
+            return name
         return f"Unknown({tag})"
 
     def has_tag(self, tag: int) -> bool:
         """Check if a tag is defined in the dictionary."""
         return tag in self._tags
 
-    def all_tags(self) -> list[int]:
-        """Get all defined tag numbers."""
-        return list(self._tags.keys())
+    def all_tags(self) -> frozenset[int]:
+        """Get all defined tag numbers.
+
+        The set is cached until the dictionary next changes, so repeated
+        calls and membership checks on the result are cheap.
+        """
+        if self._all_tags_cache is None:
+            self._all_tags_cache = frozenset(self._tags)
+        return self._all_tags_cache
 
     def merge(self, other: "TagDictionary") -> None:
-        """Merge another dictionary into this one."""
-        for tag, definition in other._tags.items():
-            self._tags[tag] = definition
+        """Merge another dictionary into this one.
+
+        Definitions from ``other`` override existing ones for the same tag.
+        """
+        self._tags.update(other._tags)
+        self._names.update(other._names)
+        self._all_tags_cache = None
+
+    @classmethod
+    def from_definitions(cls, definitions: Iterable[FixFieldDefinition]) -> "TagDictionary":
+        """Build a dictionary from definitions in one pass.
+
+        Later definitions for the same tag override earlier ones, exactly as
+        repeated :meth:`add` calls would.
+        """
+        dictionary = cls()
+        dictionary._tags = {definition.tag: definition for definition in definitions}
+        dictionary._names = {tag: definition.name for tag, definition in dictionary._tags.items()}
+        return dictionary
 
     @classmethod
     def default(cls) -> "TagDictionary":
@@ -62,20 +96,16 @@ class TagDictionary:
         from fxfixparser.tags.fix44 import FIX44_TAGS
         from fxfixparser.tags.fx_tags import FX_CUSTOM_TAGS
 
-        dictionary = cls()
-
-        # 1. Load all standard tags from the XML spec as a comprehensive base
-        xml_fields = load_fix44_fields()
-        for definition in xml_fields:
-            dictionary.add(definition)
-
-        # 2. Override with manually-curated tags (richer FX-focused descriptions)
-        for definition in FIX44_TAGS:
-            dictionary.add(definition)
-
-        # 3. Add FX-specific custom tags
-        for definition in FX_CUSTOM_TAGS:
-            dictionary.add(definition)
+        dictionary = cls.from_definitions(
+            chain(
+                # 1. All standard tags from the XML spec as a comprehensive base
+                load_fix44_fields(),
+                # 2. Manually-curated tags (richer FX-focused descriptions)
+                FIX44_TAGS,
+                # 3. FX-specific custom tags
+                FX_CUSTOM_TAGS,
+            )
+        )
 
         cls._default_instance = dictionary
         return dictionary
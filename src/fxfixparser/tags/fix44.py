@@ -1,8 +1,11 @@
 """FIX 4.4 standard tag definitions."""
 
+from types import MappingProxyType
+from typing import Mapping
+
 from fxfixparser.core.field import FixFieldDefinition
 
-FIX44_TAGS: list[FixFieldDefinition] = [
+FIX44_TAGS: tuple[FixFieldDefinition, ...] = (
     # Header fields
     FixFieldDefinition(
         8,
@@ -1176,4 +1179,9 @@ FIX44_TAGS: list[FixFieldDefinition] = [
     FixFieldDefinition(
         292, "CorporateAction", "MULTIPLEVALUESTRING", "Corporate action indicator."
     ),
-]
+)
+
+# FIX 4.4 definitions keyed by tag number, for direct lookups.
+FIX44_TAGS_BY_NUMBER: Mapping[int, FixFieldDefinition] = MappingProxyType(
+    {definition.tag: definition for definition in FIX44_TAGS}
+)
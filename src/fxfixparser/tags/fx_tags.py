@@ -1,5 +1,8 @@
 """FX-specific custom tag definitions based on LiquidityFX (LFX) FIX specification."""
 
+from types import MappingProxyType
+from typing import Mapping
+
 from fxfixparser.core.field import FixFieldDefinition
 
 # Supported tenor codes from LFX specification section 11.9
@@ -70,7 +73,7 @@ LFX_TENOR_VALUES = {
     "ME12": "Last day of current month + 11 months",
 }
 
-FX_CUSTOM_TAGS: list[FixFieldDefinition] = [
+FX_CUSTOM_TAGS: tuple[FixFieldDefinition, ...] = (
     # ============================================================================
     # Standard FIX tags not in FIX 4.4 XML but used in repeating groups
     # (FIX 5.0 / FIX 5.0 SP2 additions)
@@ -990,4 +993,9 @@ FX_CUSTOM_TAGS: list[FixFieldDefinition] = [
             "N": "False (Risk Increasing)",
         },
     ),
-]
+)
+
+# FX custom definitions keyed by tag number, for direct lookups.
+FX_CUSTOM_TAGS_BY_NUMBER: Mapping[int, FixFieldDefinition] = MappingProxyType(
+    {definition.tag: definition for definition in FX_CUSTOM_TAGS}
+)
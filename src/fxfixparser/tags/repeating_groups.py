@@ -6,22 +6,31 @@ tags that belong to each group entry.
 """
 
 from dataclasses import dataclass, field
+from typing import AbstractSet
 
 
 @dataclass
 class RepeatingGroupDefinition:
-    """Definition of a repeating group structure."""
+    """Definition of a repeating group structure.
+
+    Member tag sets are frozen on construction; they are probed once per
+    field while splitting a message into group entries.
+    """
 
     count_tag: int  # The NUMINGROUP tag that indicates how many entries follow
     name: str  # Human-readable name for the group
-    member_tags: set[int]  # Tags that belong to each group entry
+    member_tags: AbstractSet[int]  # Tags that belong to each group entry
     # Members that come from a *nested* subgroup flattened into this one. The
     # entry-boundary rule ("a member tag seen twice starts a new entry") must
     # not apply to them: a nested subgroup legitimately repeats its own tags
     # inside a single parent entry (e.g. one MAPI party carries two or three
     # PartySubIDs, one MAPI TradeCaptureReport side carries two SettlDetails).
     # Only tags that identify a *parent* entry may open a new one.
-    nested_member_tags: set[int] = field(default_factory=set)
+    nested_member_tags: AbstractSet[int] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        self.member_tags = frozenset(self.member_tags)
+        self.nested_member_tags = frozenset(self.nested_member_tags)
 
 
 # Standard FIX 4.4 repeating groups commonly used in FX
@@ -536,6 +545,14 @@ REPEATING_GROUPS: list[RepeatingGroupDefinition] = [
 ]
 
 
+# Count tag -> group definition, built once so lookups are a single dict probe.
+_COUNT_TAG_TO_GROUP: dict[int, RepeatingGroupDefinition] = {
+    group.count_tag: group for group in REPEATING_GROUPS
+}
+# All count tags, for the membership-only check in is_count_tag.
+_COUNT_TAGS: frozenset[int] = frozenset(_COUNT_TAG_TO_GROUP)
+
+
 def get_group_definition(count_tag: int) -> RepeatingGroupDefinition | None:
     """Get the repeating group definition for a given count tag.
 
@@ -545,12 +562,9 @@ def get_group_definition(count_tag: int) -> RepeatingGroupDefinition | None:
     Returns:
         The group definition if found, None otherwise.
     """
-    for group in REPEATING_GROUPS:
-        if group.count_tag == count_tag:
-            return group
-    return None
+    return _COUNT_TAG_TO_GROUP.get(count_tag)
 
 
 def is_count_tag(tag: int) -> bool:
     """Check if a tag is a repeating group count tag."""
-    return any(group.count_tag == tag for group in REPEATING_GROUPS)
+    return tag in _COUNT_TAGS
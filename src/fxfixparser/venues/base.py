@@ -1,6 +1,7 @@
 """Abstract base class for venue handlers."""
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 
 from fxfixparser.core.field import FixField, FixFieldDefinition
 from fxfixparser.core.fx_math import parse_symbol, pip_size, swap_side_actions
@@ -430,7 +431,12 @@ class VenueHandler(ABC):
         """Check if a SenderCompID matches this venue."""
         if not sender_comp_id:
             return False
-        return sender_comp_id.upper() in [s.upper() for s in self.sender_comp_ids]
+        return sender_comp_id.casefold() in self._casefolded_sender_comp_ids
+
+    @cached_property
+    def _casefolded_sender_comp_ids(self) -> frozenset[str]:
+        """Casefolded SenderCompIDs, built once per handler for matching."""
+        return frozenset(s.casefold() for s in self.sender_comp_ids)
 
     def claims_message(self, message: FixMessage) -> bool:
         """Return True if this handler recognises the message by its protocol
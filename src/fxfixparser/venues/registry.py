@@ -22,10 +22,20 @@ class VenueRegistry:
 
     def __init__(self) -> None:
         self._venues: dict[str, VenueHandler] = {}
+        # Casefolded SenderCompID -> handler. Where two venues share an ID
+        # the one registered first wins, as a scan in registration order would.
+        self._sender_index: dict[str, VenueHandler] = {}
 
     def register(self, handler: VenueHandler) -> None:
         """Register a venue handler."""
         self._venues[handler.name.lower()] = handler
+        # Rebuilt rather than extended: re-registering a name replaces the
+        # handler in place, which can change which venue owns a shared ID.
+        index: dict[str, VenueHandler] = {}
+        for venue in self._venues.values():
+            for sender_id in venue.sender_comp_ids:
+                index.setdefault(sender_id.casefold(), venue)
+        self._sender_index = index
 
     def get(self, name: str) -> VenueHandler | None:
         """Get a venue handler by name."""
@@ -35,10 +45,7 @@ class VenueRegistry:
         """Get a venue handler by SenderCompID."""
         if not sender_comp_id:
             return None
-        for handler in self._venues.values():
-            if handler.matches_sender(sender_comp_id):
-                return handler
-        return None
+        return self._sender_index.get(sender_comp_id.casefold())
 
     def detect_from_message(self, message: FixMessage) -> VenueHandler | None:
         """Detect a venue handler from a parsed message.
@@ -7,6 +7,227 @@ from fxfixparser.core.field import FixFieldDefinition
 from fxfixparser.tags.fx_tags import LFX_TENOR_VALUES
 from fxfixparser.venues.base import VenueHandler
 
+# LiquidityFX custom tags from the LFX FIX ROE specification, keyed by tag.
+_SMART_TRADE_CUSTOM_TAGS: dict[int, FixFieldDefinition] = {
+    # MassQuote entry identifiers
+    8000: FixFieldDefinition(
+        8000,
+        "BidEntryID",
+        "STRING",
+        "Uniquely identifies the bid quote in a MassQuote message.",
+    ),
+    8001: FixFieldDefinition(
+        8001,
+        "OfferEntryID",
+        "STRING",
+        "Uniquely identifies the offer quote in a MassQuote message.",
+    ),
+    # FX Swap settlement type (tenor) for far leg
+    8004: FixFieldDefinition(
+        8004,
+        "SettlType2",
+        "STRING",
+        "FX Swap: Far Leg Tenor. See Supported Tenor Codes.",
+        LFX_TENOR_VALUES,
+    ),
+    # FX Swap spot rates for far leg
+    8011: FixFieldDefinition(
+        8011, "BidSpotRate2", "PRICE", "FX Swap: Bid entry spot rate of the far leg."
+    ),
+    8012: FixFieldDefinition(
+        8012, "OfferSpotRate2", "PRICE", "FX Swap: Offer entry spot rate of the far leg."
+    ),
+    # FX Swap sizes for far leg
+    8013: FixFieldDefinition(
+        8013, "BidSize2", "QTY", "FX Swap: Size of the far leg (bid entry/quote)."
+    ),
+    8014: FixFieldDefinition(
+        8014, "OfferSize2", "QTY", "FX Swap: Size of the far leg (offer entry/quote)."
+    ),
+    # FX Swap settlement dates (MassQuote)
+    8015: FixFieldDefinition(
+        8015,
+        "BidSettlDate",
+        "LOCALMKTDATE",
+        "Settlement date for the bid quote (YYYYMMDD). FX Swap: near leg.",
+    ),
+    8016: FixFieldDefinition(
+        8016,
+        "BidSettlDate2",
+        "LOCALMKTDATE",
+        "FX Swap: Settlement date for the far leg of the bid quote (YYYYMMDD).",
+    ),
+    8017: FixFieldDefinition(
+        8017,
+        "OfferSettlDate",
+        "LOCALMKTDATE",
+        "Settlement date for the offer quote (YYYYMMDD). FX Swap: near leg.",
+    ),
+    8018: FixFieldDefinition(
+        8018,
+        "OfferSettlDate2",
+        "LOCALMKTDATE",
+        "FX Swap: Settlement date for the far leg of the offer quote (YYYYMMDD).",
+    ),
+    # FX Swap all-in prices for far leg
+    8019: FixFieldDefinition(
+        8019, "BidPx2", "PRICE", "FX Swap: The all-in price of the bid entry's far leg."
+    ),
+    8020: FixFieldDefinition(
+        8020, "OfferPx2", "PRICE", "FX Swap: The all-in price of the offer entry's far leg."
+    ),
+    # Quote currencies
+    8021: FixFieldDefinition(8021, "BidCurrency", "CURRENCY", "Currency of the bid quote."),
+    8022: FixFieldDefinition(8022, "OfferCurrency", "CURRENCY", "Currency of the offer quote."),
+    # Swap points (1000 range)
+    1065: FixFieldDefinition(
+        1065,
+        "BidSwapPoints",
+        "PRICEOFFSET",
+        "FX Swap: Swap points of the bid entry (far leg - near leg price difference).",
+    ),
+    1066: FixFieldDefinition(
+        1066,
+        "OfferSwapPoints",
+        "PRICEOFFSET",
+        "FX Swap: Swap points of the offer entry (far leg - near leg price difference).",
+    ),
+    # Market Data Request size tiers (9000 range)
+    9000: FixFieldDefinition(
+        9000,
+        "NoRequestedSize",
+        "NUMINGROUP",
+        "Number of size tiers for tiered market data quotes.",
+    ),
+    9001: FixFieldDefinition(
+        9001, "RequestedSize", "QTY", "The size of the quote tier for tiered market data."
+    ),
+    # Market Data timestamps
+    9122: FixFieldDefinition(
+        9122,
+        "MDEntryOrigTime",
+        "UTCTIMEONLY",
+        "UTC time received from venue (HH:mm:ss.SSS). Only when AggregatedBook=N.",
+    ),
+    # Execution Report - Swap leg prices and quantities
+    9044: FixFieldDefinition(
+        9044,
+        "MaturityDate2",
+        "LOCALMKTDATE",
+        "For NDS, fixing date of the far leg (YYYYMMDD).",
+    ),
+    9091: FixFieldDefinition(
+        9091, "LastPx2", "PRICE", "For Swap, LastPx (fill price) of the far leg."
+    ),
+    9092: FixFieldDefinition(9092, "LastQty2", "QTY", "For swaps, fill amount of the far leg."),
+    9093: FixFieldDefinition(9093, "LeavesQty2", "QTY", "For swap, open quantity of far leg."),
+    9094: FixFieldDefinition(
+        9094, "CumQty2", "QTY", "FX Swaps: Cumulative filled quantity of far leg."
+    ),
+    9095: FixFieldDefinition(
+        9095, "LastSpotRate2", "PRICE", "For Swap, LastSpotRate of the far leg."
+    ),
+    # Fixing orders
+    9300: FixFieldDefinition(9300, "FixingSourceID", "STRING", "ID of the fixing source."),
+    9301: FixFieldDefinition(
+        9301,
+        "FixingTime",
+        "UTCTIMESTAMP",
+        "UTC date/time for fixing orders (YYYYMMDD-HH:mm:ss.SSS).",
+    ),
+    # Regulatory
+    9400: FixFieldDefinition(
+        9400,
+        "RegulationType",
+        "STRING",
+        "Type of regulated venue: SEF, MTF, or XOFF.",
+        {
+            "SEF": "Swap Execution Facility (US)",
+            "MTF": "Multilateral Trading Facility (EU MIFID2)",
+            "XOFF": "Off-exchange/Other",
+        },
+    ),
+    # UTI
+    10002: FixFieldDefinition(10002, "UTIPrefix", "STRING", "Unique Trade Id prefix."),
+    10003: FixFieldDefinition(10003, "UTI", "STRING", "Unique Trade Id."),
+    10011: FixFieldDefinition(
+        10011,
+        "IsSEFTrade",
+        "BOOLEAN",
+        "Whether order is traded on SEF or off SEF facility.",
+    ),
+    # Forward Rolls
+    9011: FixFieldDefinition(
+        9011, "ClRootOrderID", "STRING", "Forward Rolls: ID of the spot order to roll."
+    ),
+    # Allocations
+    11001: FixFieldDefinition(
+        11001,
+        "RequestType",
+        "CHAR",
+        "Indicates multileg QuoteRequest. M=MULTILEG.",
+        {
+            "M": "Multileg",
+        },
+    ),
+    11003: FixFieldDefinition(
+        11003, "AllocationID", "STRING", "Client ID for the pre-allocation group."
+    ),
+    11078: FixFieldDefinition(11078, "C_NoAllocs", "NUMINGROUP", "Number of pre-allocations."),
+    11079: FixFieldDefinition(
+        11079, "C_AllocAccount", "STRING", "Account for this allocation leg."
+    ),
+    11467: FixFieldDefinition(
+        11467, "C_IndividualAllocID", "STRING", "Client identifier for this allocation leg."
+    ),
+    11080: FixFieldDefinition(11080, "C_AllocQty", "QTY", "Quantity to be allocated (positive)."),
+    11054: FixFieldDefinition(
+        11054,
+        "C_AllocSide",
+        "CHAR",
+        "Side of allocation leg.",
+        {
+            "B": "AS_DEFINED (same side)",
+            "C": "OPPOSITE (opposite side)",
+            "U": "UNDISCLOSED",
+        },
+    ),
+    11063: FixFieldDefinition(
+        11063,
+        "C_AllocSettlType",
+        "STRING",
+        "Swaps: tenor of allocation leg.",
+        LFX_TENOR_VALUES,
+    ),
+    11064: FixFieldDefinition(
+        11064,
+        "C_AllocSettlDate",
+        "LOCALMKTDATE",
+        "Swaps: value date of allocation leg (YYYYMMDD).",
+    ),
+    # Leg allocations
+    11670: FixFieldDefinition(
+        11670, "C_NoLegAllocs", "NUMINGROUP", "Number of allocations for this leg."
+    ),
+    11671: FixFieldDefinition(
+        11671, "C_LegAllocAccount", "STRING", "Allocation account for this leg."
+    ),
+    11672: FixFieldDefinition(
+        11672, "C_LegIndividualAllocID", "STRING", "ID of this allocation leg."
+    ),
+    11673: FixFieldDefinition(11673, "C_LegAllocQty", "QTY", "Quantity to allocate for this leg."),
+    11654: FixFieldDefinition(
+        11654,
+        "C_LegAllocSide",
+        "CHAR",
+        "Side of this allocation leg.",
+        {
+            "B": "AS_DEFINED (same side as leg)",
+            "C": "OPPOSITE (opposite side to leg)",
+        },
+    ),
+}
+
 
 class SmartTradeHandler(VenueHandler):
     """Handler for Smart Trade LiquidityFX FIX messages."""
@@ -26,222 +247,8 @@ class SmartTradeHandler(VenueHandler):
         These tags are defined in the LFX FIX ROE specification and are used
         primarily for FX Swap trading.
         """
-        return [
-            # MassQuote entry identifiers
-            FixFieldDefinition(
-                8000,
-                "BidEntryID",
-                "STRING",
-                "Uniquely identifies the bid quote in a MassQuote message.",
-            ),
-            FixFieldDefinition(
-                8001,
-                "OfferEntryID",
-                "STRING",
-                "Uniquely identifies the offer quote in a MassQuote message.",
-            ),
-            # FX Swap settlement type (tenor) for far leg
-            FixFieldDefinition(
-                8004,
-                "SettlType2",
-                "STRING",
-                "FX Swap: Far Leg Tenor. See Supported Tenor Codes.",
-                LFX_TENOR_VALUES,
-            ),
-            # FX Swap spot rates for far leg
-            FixFieldDefinition(
-                8011, "BidSpotRate2", "PRICE", "FX Swap: Bid entry spot rate of the far leg."
-            ),
-            FixFieldDefinition(
-                8012, "OfferSpotRate2", "PRICE", "FX Swap: Offer entry spot rate of the far leg."
-            ),
-            # FX Swap sizes for far leg
-            FixFieldDefinition(
-                8013, "BidSize2", "QTY", "FX Swap: Size of the far leg (bid entry/quote)."
-            ),
-            FixFieldDefinition(
-                8014, "OfferSize2", "QTY", "FX Swap: Size of the far leg (offer entry/quote)."
-            ),
-            # FX Swap settlement dates (MassQuote)
-            FixFieldDefinition(
-                8015,
-                "BidSettlDate",
-                "LOCALMKTDATE",
-                "Settlement date for the bid quote (YYYYMMDD). FX Swap: near leg.",
-            ),
-            FixFieldDefinition(
-                8016,
-                "BidSettlDate2",
-                "LOCALMKTDATE",
-                "FX Swap: Settlement date for the far leg of the bid quote (YYYYMMDD).",
-            ),
-            FixFieldDefinition(
-                8017,
-                "OfferSettlDate",
-                "LOCALMKTDATE",
-                "Settlement date for the offer quote (YYYYMMDD). FX Swap: near leg.",
-            ),
-            FixFieldDefinition(
-                8018,
-                "OfferSettlDate2",
-                "LOCALMKTDATE",
-                "FX Swap: Settlement date for the far leg of the offer quote (YYYYMMDD).",
-            ),
-            # FX Swap all-in prices for far leg
-            FixFieldDefinition(
-                8019, "BidPx2", "PRICE", "FX Swap: The all-in price of the bid entry's far leg."
-            ),
-            FixFieldDefinition(
-                8020, "OfferPx2", "PRICE", "FX Swap: The all-in price of the offer entry's far leg."
-            ),
-            # Quote currencies
-            FixFieldDefinition(8021, "BidCurrency", "CURRENCY", "Currency of the bid quote."),
-            FixFieldDefinition(8022, "OfferCurrency", "CURRENCY", "Currency of the offer quote."),
-            # Swap points (1000 range)
-            FixFieldDefinition(
-                1065,
-                "BidSwapPoints",
-                "PRICEOFFSET",
-                "FX Swap: Swap points of the bid entry (far leg - near leg price difference).",
-            ),
-            FixFieldDefinition(
-                1066,
-                "OfferSwapPoints",
-                "PRICEOFFSET",
-                "FX Swap: Swap points of the offer entry (far leg - near leg price difference).",
-            ),
-            # Market Data Request size tiers (9000 range)
-            FixFieldDefinition(
-                9000,
-                "NoRequestedSize",
-                "NUMINGROUP",
-                "Number of size tiers for tiered market data quotes.",
-            ),
-            FixFieldDefinition(
-                9001, "RequestedSize", "QTY", "The size of the quote tier for tiered market data."
-            ),
-            # Market Data timestamps
-            FixFieldDefinition(
-                9122,
-                "MDEntryOrigTime",
-                "UTCTIMEONLY",
-                "UTC time received from venue (HH:mm:ss.SSS). Only when AggregatedBook=N.",
-            ),
-            # Execution Report - Swap leg prices and quantities
-            FixFieldDefinition(
-                9044,
-                "MaturityDate2",
-                "LOCALMKTDATE",
-                "For NDS, fixing date of the far leg (YYYYMMDD).",
-            ),
-            FixFieldDefinition(
-                9091, "LastPx2", "PRICE", "For Swap, LastPx (fill price) of the far leg."
-            ),
-            FixFieldDefinition(9092, "LastQty2", "QTY", "For swaps, fill amount of the far leg."),
-            FixFieldDefinition(9093, "LeavesQty2", "QTY", "For swap, open quantity of far leg."),
-            FixFieldDefinition(
-                9094, "CumQty2", "QTY", "FX Swaps: Cumulative filled quantity of far leg."
-            ),
-            FixFieldDefinition(
-                9095, "LastSpotRate2", "PRICE", "For Swap, LastSpotRate of the far leg."
-            ),
-            # Fixing orders
-            FixFieldDefinition(9300, "FixingSourceID", "STRING", "ID of the fixing source."),
-            FixFieldDefinition(
-                9301,
-                "FixingTime",
-                "UTCTIMESTAMP",
-                "UTC date/time for fixing orders (YYYYMMDD-HH:mm:ss.SSS).",
-            ),
-            # Regulatory
-            FixFieldDefinition(
-                9400,
-                "RegulationType",
-                "STRING",
-                "Type of regulated venue: SEF, MTF, or XOFF.",
-                {
-                    "SEF": "Swap Execution Facility (US)",
-                    "MTF": "Multilateral Trading Facility (EU MIFID2)",
-                    "XOFF": "Off-exchange/Other",
-                },
-            ),
-            # UTI
-            FixFieldDefinition(10002, "UTIPrefix", "STRING", "Unique Trade Id prefix."),
-            FixFieldDefinition(10003, "UTI", "STRING", "Unique Trade Id."),
-            FixFieldDefinition(
-                10011,
-                "IsSEFTrade",
-                "BOOLEAN",
-                "Whether order is traded on SEF or off SEF facility.",
-            ),
-            # Forward Rolls
-            FixFieldDefinition(
-                9011, "ClRootOrderID", "STRING", "Forward Rolls: ID of the spot order to roll."
-            ),
-            # Allocations
-            FixFieldDefinition(
-                11001,
-                "RequestType",
-                "CHAR",
-                "Indicates multileg QuoteRequest. M=MULTILEG.",
-                {
-                    "M": "Multileg",
-                },
-            ),
-            FixFieldDefinition(
-                11003, "AllocationID", "STRING", "Client ID for the pre-allocation group."
-            ),
-            FixFieldDefinition(11078, "C_NoAllocs", "NUMINGROUP", "Number of pre-allocations."),
-            FixFieldDefinition(
-                11079, "C_AllocAccount", "STRING", "Account for this allocation leg."
-            ),
-            FixFieldDefinition(
-                11467, "C_IndividualAllocID", "STRING", "Client identifier for this allocation leg."
-            ),
-            FixFieldDefinition(11080, "C_AllocQty", "QTY", "Quantity to be allocated (positive)."),
-            FixFieldDefinition(
-                11054,
-                "C_AllocSide",
-                "CHAR",
-                "Side of allocation leg.",
-                {
-                    "B": "AS_DEFINED (same side)",
-                    "C": "OPPOSITE (opposite side)",
-                    "U": "UNDISCLOSED",
-                },
-            ),
-            FixFieldDefinition(
-                11063,
-                "C_AllocSettlType",
-                "STRING",
-                "Swaps: tenor of allocation leg.",
-                LFX_TENOR_VALUES,
-            ),
-            FixFieldDefinition(
-                11064,
-                "C_AllocSettlDate",
-                "LOCALMKTDATE",
-                "Swaps: value date of allocation leg (YYYYMMDD).",
-            ),
-            # Leg allocations
-            FixFieldDefinition(
-                11670, "C_NoLegAllocs", "NUMINGROUP", "Number of allocations for this leg."
-            ),
-            FixFieldDefinition(
-                11671, "C_LegAllocAccount", "STRING", "Allocation account for this leg."
-            ),
-            FixFieldDefinition(
-                11672, "C_LegIndividualAllocID", "STRING", "ID of this allocation leg."
-            ),
-            FixFieldDefinition(11673, "C_LegAllocQty", "QTY", "Quantity to allocate for this leg."),
-            FixFieldDefinition(
-                11654,
-                "C_LegAllocSide",
-                "CHAR",
-                "Side of this allocation leg.",
-                {
-                    "B": "AS_DEFINED (same side as leg)",
-                    "C": "OPPOSITE (opposite side to leg)",
-                },
-            ),
-        ]
+        return list(_SMART_TRADE_CUSTOM_TAGS.values())
+
+    def get_custom_tag(self, tag: int) -> FixFieldDefinition | None:
+        """Return the Smart Trade definition for ``tag``, or None."""
+        return _SMART_TRADE_CUSTOM_TAGS.get(tag)
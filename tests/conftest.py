@@ -1,11 +1,23 @@
 """Pytest configuration and shared fixtures."""
 
+from typing import Iterator
+
 import pytest
 
+from fxfixparser.core.message import FixMessage
 from fxfixparser.core.parser import FixParser, ParserConfig
 from fxfixparser.products.base import ProductRegistry
 from fxfixparser.tags.dictionary import TagDictionary
 from fxfixparser.venues.registry import VenueRegistry
+from tests.fixtures.sample_messages import FORWARD_MESSAGE, SPOT_MESSAGE_PIPE, SWAP_MESSAGE
+
+
+@pytest.fixture(scope="session", autouse=True)
+def spec_cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Keep the spec loader's pickle cache out of the user's cache directory."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("FXFIXPARSER_CACHE_DIR", str(tmp_path_factory.mktemp("spec-cache")))
+        yield
 
 
 @pytest.fixture
@@ -38,3 +50,37 @@ def venue_registry() -> VenueRegistry:
 def product_registry() -> ProductRegistry:
     """Create a default product registry."""
     return ProductRegistry.default()
+
+
+@pytest.fixture(scope="session")
+def shared_parser() -> FixParser:
+    """One non-strict parser for tests that only parse.
+
+    FixParser keeps no per-message state, so it is safe to share; use the
+    function-scoped ``parser`` fixture for tests that change its config.
+    """
+    return FixParser(config=ParserConfig(strict_checksum=False))
+
+
+@pytest.fixture(scope="session")
+def shared_venues() -> VenueRegistry:
+    """One default venue registry for tests that only look handlers up."""
+    return VenueRegistry.default()
+
+
+@pytest.fixture(scope="session")
+def parsed_spot(shared_parser: FixParser) -> FixMessage:
+    """SPOT_MESSAGE_PIPE parsed once; ``copy.copy`` it before mutating."""
+    return shared_parser.parse(SPOT_MESSAGE_PIPE)
+
+
+@pytest.fixture(scope="session")
+def parsed_swap(shared_parser: FixParser) -> FixMessage:
+    """SWAP_MESSAGE parsed once; ``copy.copy`` it before mutating."""
+    return shared_parser.parse(SWAP_MESSAGE)
+
+
+@pytest.fixture(scope="session")
+def parsed_forward(shared_parser: FixParser) -> FixMessage:
+    """FORWARD_MESSAGE parsed once; ``copy.copy`` it before mutating."""
+    return shared_parser.parse(FORWARD_MESSAGE)
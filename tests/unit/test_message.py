@@ -1,5 +1,9 @@
 """Unit tests for FixMessage and related classes."""
 
+import dataclasses
+
+import pytest
+
 from fxfixparser.core.field import FixField, FixFieldDefinition
 from fxfixparser.core.message import FixMessage, ParsedTrade
 
@@ -30,6 +34,23 @@ class TestFixFieldDefinition:
         assert defn.get_value_description("2") == "Sell"
         assert defn.get_value_description("3") is None
 
+    def test_definition_is_immutable(self) -> None:
+        """Definitions are shared between dictionaries, so they are frozen."""
+        defn = FixFieldDefinition(tag=55, name="Symbol")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            defn.name = "Other"  # type: ignore[misc]
+
+    def test_definition_names_are_interned(self) -> None:
+        """Equal names and types built at runtime share one string object."""
+        name = "".join(["Acc", "ount"])
+        field_type = "".join(["ST", "RING"])
+        a = FixFieldDefinition(tag=1, name=name, field_type=field_type)
+        b = FixFieldDefinition(tag=1, name="Account", field_type="STRING")
+
+        assert a.name is b.name
+        assert a.field_type is b.field_type
+
 
 class TestFixField:
     """Tests for FixField class."""
@@ -45,6 +66,37 @@ class TestFixField:
         assert field.value_description is None
         assert field.typed_value == "test"
 
+    def test_field_equality_ignores_definition(self) -> None:
+        """Fields compare and hash by tag and raw value."""
+        defn = FixFieldDefinition(tag=54, name="Side")
+        a = FixField(tag=54, raw_value="1", definition=defn)
+        b = FixField(tag=54, raw_value="1")
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != FixField(tag=54, raw_value="2")
+        assert a != FixField(tag=55, raw_value="1")
+        assert len({a, b}) == 1
+
+    def test_field_is_immutable(self) -> None:
+        """Parsed fields cannot be modified after construction."""
+        field = FixField(tag=54, raw_value="1")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            field.raw_value = "2"  # type: ignore[misc]
+
+    def test_fast_constructor_matches_init(self) -> None:
+        """FixField.fast builds the same immutable field as the constructor."""
+        defn = FixFieldDefinition(tag=54, name="Side", valid_values={"1": "BUY"})
+        field = FixField.fast(54, "1", defn)
+
+        assert field == FixField(tag=54, raw_value="1", definition=defn)
+        assert field.definition is defn
+        assert field.value_description == "BUY"
+        assert FixField.fast(54, "1").definition is None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            field.raw_value = "2"  # type: ignore[misc]
+
     def test_field_with_definition(self) -> None:
         """Test field with definition."""
         defn = FixFieldDefinition(
@@ -178,6 +230,60 @@ class TestFixMessage:
         tags = [f.tag for f in message]
         assert tags == [8, 35]
 
+    def test_get_field_returns_first_occurrence(self) -> None:
+        """Lookup by tag returns the first field and follows field replacement."""
+        message = FixMessage(
+            fields=[
+                FixField(tag=8, raw_value="FIX.4.4"),
+                FixField(tag=448, raw_value="FIRST"),
+                FixField(tag=448, raw_value="SECOND"),
+            ]
+        )
+
+        assert message.get_value(448) == "FIRST"
+        assert message.get_field(55) is None
+
+        message.fields = [FixField(tag=55, raw_value="EUR/USD")]
+        assert message.get_value(55) == "EUR/USD"
+        assert message.get_field(448) is None
+
+    def test_in_place_field_edits_refresh_lookups(self) -> None:
+        """Growing or shrinking the list in place, or replacing it, is seen by
+        cached lookups."""
+        message = FixMessage(
+            fields=[FixField(tag=8, raw_value="FIX.4.4"), FixField(tag=35, raw_value="8")]
+        )
+        assert message.get_value(55) is None
+        assert len(message.get_structured_fields()) == 2
+
+        message.fields.append(FixField(tag=55, raw_value="EUR/USD"))
+        assert message.get_value(55) == "EUR/USD"
+        assert len(message.get_structured_fields()) == 3
+
+        message.fields[1:2] = [FixField(tag=268, raw_value="1"), FixField(tag=269, raw_value="0")]
+        structured = message.get_structured_fields()
+        assert structured[1].group is not None
+        assert [f.tag for f in structured[1].group.entries[0].fields] == [269]
+
+        del message.fields[0]
+        assert message.begin_string is None
+
+        # Same-length edits take effect once the list is reassigned.
+        fields = list(message.fields)
+        fields[0] = FixField(tag=35, raw_value="D")
+        message.fields = fields
+        assert message.msg_type == "D"
+
+    def test_message_with_out_of_range_tag(self) -> None:
+        """A tag number too large for the compact tag index is still handled."""
+        fields = [
+            FixField(tag=8, raw_value="FIX.4.4"),
+            FixField(tag=2**40, raw_value="x"),
+        ]
+        message = FixMessage(fields=fields)
+
+        assert len(message.get_structured_fields()) == 2
+
     def test_message_to_dict(self) -> None:
         """Test message to_dict conversion."""
         fields = [
@@ -92,6 +92,18 @@ class TestFixParser:
         assert len(fields) == 1
         assert fields[0].raw_value == "EUR/USD"
 
+    def test_extract_fields_converts_tag_numbers(self, parser: FixParser) -> None:
+        """Test tag strings are converted to ints, including zero-padded ones."""
+        fields = parser._extract_fields("8=FIX.4.4\x01035=D\x0111080=1\x01035=D\x01")
+
+        assert fields == [(8, "FIX.4.4"), (35, "D"), (11080, "1"), (35, "D")]
+
+    def test_overlong_tag_number_is_skipped(self, parser: FixParser) -> None:
+        """A tag too long for int() is dropped instead of raising ValueError."""
+        message = parser.parse("8=FIX.4.4|9=10|35=8|" + "9" * 5000 + "=x|55=EUR/USD|10=000|")
+
+        assert [f.tag for f in message.fields] == [8, 9, 35, 55, 10]
+
     def test_calculate_checksum(self) -> None:
         """Test checksum calculation."""
         # Test with simple string
@@ -101,6 +113,13 @@ class TestFixParser:
         # Checksum should be 3 digits zero-padded
         assert len(checksum) == 3
         assert checksum.isdigit()
+        assert checksum == f"{sum(map(ord, body)) % 256:03d}"
+
+    def test_calculate_checksum_non_latin1(self) -> None:
+        """Test checksum sums code points for text outside Latin-1."""
+        body = "8=FIX.4.4\x0158=€\x01"
+
+        assert FixParser.calculate_checksum(body) == f"{sum(map(ord, body)) % 256:03d}"
 
     def test_parser_config_defaults(self) -> None:
         """Test ParserConfig default values."""
@@ -177,6 +196,16 @@ class TestCRLFNormalization:
         assert message.checksum == "000"
         assert message.fields[-1].tag == 10
 
+    def test_pipe_message_with_line_wrapping(self) -> None:
+        """Test that pipes and wrapped lines are normalized together."""
+        parser = FixParser(config=ParserConfig(strict_checksum=False))
+        msg = "8=FIX.4.4|9=100|35=8|49=FXGO|56=CLIENT|58=Long\r\ntext|55=EUR/USD\n15=EUR|10=000|"
+        message = parser.parse(msg)
+
+        assert message.get_value(58) == "Longtext"
+        assert message.get_value(55) == "EUR/USD"
+        assert message.get_value(15) == "EUR"
+
 
 class TestStrictDelimiter:
     """Tests for strict_delimiter config option."""
@@ -1,5 +1,10 @@
 """Unit tests for repeating groups functionality."""
 
+import json
+import logging
+
+import pytest
+
 from fxfixparser.core.field import FixField, FixFieldDefinition
 from fxfixparser.core.message import FixMessage, RepeatingGroup, RepeatingGroupEntry
 from fxfixparser.tags.repeating_groups import get_group_definition, is_count_tag
@@ -139,6 +144,13 @@ class TestRepeatingGroupDefinitions:
         group = get_group_definition(9999)
         assert group is None
 
+    def test_member_tags_are_frozen(self) -> None:
+        """Member tag sets are frozen so the shared definitions can't drift."""
+        group = get_group_definition(268)
+        assert group is not None
+        assert isinstance(group.member_tags, frozenset)
+        assert isinstance(group.nested_member_tags, frozenset)
+
     def test_is_count_tag(self) -> None:
         """Test is_count_tag function."""
         assert is_count_tag(268) is True  # NoMDEntries
@@ -218,6 +230,17 @@ class TestRepeatingGroupEntry:
         assert d["index"] == 1
         assert len(d["fields"]) == 1
 
+    def test_entries_and_groups_are_slotted(self) -> None:
+        """Test that group objects carry no per-instance __dict__."""
+        entry = RepeatingGroupEntry(index=1)
+        count_field = FixField(tag=268, raw_value="1")
+        group = RepeatingGroup(name="Market Data Entries", count_field=count_field)
+
+        assert not hasattr(entry, "__dict__")
+        assert not hasattr(group, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1  # type: ignore[attr-defined]
+
 
 class TestRepeatingGroup:
     """Tests for RepeatingGroup class."""
@@ -318,6 +341,24 @@ class TestFixMessageStructuredFields:
         assert group.entries[1].index == 2
         assert group.entries[1].fields[0].raw_value == "1"  # Offer
 
+    def test_structured_fields_are_cached_until_fields_replaced(self) -> None:
+        """Repeat calls reuse the split; replacing fields recomputes it."""
+        message = FixMessage(
+            fields=[
+                FixField(tag=268, raw_value="1"),
+                FixField(tag=269, raw_value="0"),
+            ]
+        )
+
+        first = message.get_structured_fields()
+        assert message.get_structured_fields() is first
+
+        message.fields = [FixField(tag=55, raw_value="EUR/USD")]
+        structured = message.get_structured_fields()
+        assert structured is not first
+        assert len(structured) == 1
+        assert not structured[0].is_group
+
     def test_message_to_dict_structured(self) -> None:
         """Test to_dict with structured output."""
         fields = [
@@ -343,6 +384,36 @@ class TestFixMessageStructuredFields:
         assert group_dict["name"] == "Market Data Entries"
         assert group_dict["count"] == 1
 
+    def test_message_to_json_matches_to_dict(self) -> None:
+        """to_json encodes exactly the to_dict tree."""
+        fields = [
+            FixField(tag=8, raw_value="FIX.4.4"),
+            FixField(tag=268, raw_value="1"),
+            FixField(tag=269, raw_value="0"),
+        ]
+        message = FixMessage(fields=fields)
+
+        assert json.loads(message.to_json()) == message.to_dict()
+        assert json.loads(message.to_json(structured=False)) == message.to_dict(structured=False)
+        assert message.to_json(indent=True).startswith('{\n  "begin_string": "FIX.4.4"')
+
+    def test_message_to_json_out_of_range_integers(self) -> None:
+        """Tag numbers and group counts beyond 64 bits still encode, and
+        non-ASCII text is escaped."""
+        fields = [
+            FixField(tag=8, raw_value="FIX.4.4"),
+            FixField(tag=123456789012345678901234, raw_value="x"),
+            FixField(tag=268, raw_value="99999999999999999999"),
+            FixField(tag=269, raw_value="0"),
+            FixField(tag=58, raw_value="caf\u00e9"),
+        ]
+        message = FixMessage(fields=fields)
+
+        encoded = message.to_json(indent=True)
+        assert json.loads(encoded) == message.to_dict()
+        assert encoded == json.dumps(message.to_dict(), indent=2)
+        assert encoded.isascii()
+
     def test_message_to_dict_flat(self) -> None:
         """Test to_dict with flat output."""
         fields = [
@@ -522,6 +593,19 @@ class TestGroupCountValidation:
         # Should find 2 entries despite declaring 3
         assert len(group.entries) == 2
 
+    def test_huge_declared_count_is_not_trusted_for_sizing(self) -> None:
+        """Entries are sized from what is found, not from the declared count."""
+        fields = [
+            FixField(tag=268, raw_value=str(10**12)),
+            FixField(tag=269, raw_value="0"),
+            FixField(tag=269, raw_value="1"),
+        ]
+        message = FixMessage(fields=fields)
+
+        group = message.get_structured_fields()[0].group
+        assert group is not None
+        assert [e.index for e in group.entries] == [1, 2]
+
     def test_non_numeric_group_count(self) -> None:
         """Test that non-numeric group count is handled gracefully."""
         count_field = FixField(tag=268, raw_value="abc")
@@ -529,6 +613,20 @@ class TestGroupCountValidation:
 
         assert group.count == 0
 
+    def test_non_numeric_group_count_warns_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        """The group count is parsed once, so a bad count is reported once."""
+        message = FixMessage(
+            fields=[
+                FixField(tag=268, raw_value="abc"),
+                FixField(tag=269, raw_value="0"),
+            ]
+        )
+
+        with caplog.at_level(logging.WARNING, logger="fxfixparser.core.message"):
+            message.get_structured_fields()
+
+        assert sum("Non-numeric group count" in r.message for r in caplog.records) == 1
+
     def test_zero_count_produces_no_entries(self) -> None:
         """Test that count=0 produces no entries."""
         fields = [
@@ -1,11 +1,24 @@
 """Unit tests for the FIX specification XML loader."""
 
+import sys
 from pathlib import Path
 
-from fxfixparser.spec.loader import load_fix44_fields, load_fix_spec_fields
+import pytest
+
+from fxfixparser.core.field import FixFieldDefinition
+from fxfixparser.spec import loader
+from fxfixparser.spec.loader import (
+    _load_spec_fields_cached,
+    load_fix44_fields,
+    load_fix_spec_fields,
+)
 from fxfixparser.tags.dictionary import TagDictionary
 
 
+def _fail_parse(xml_path: Path) -> list[FixFieldDefinition]:
+    raise AssertionError(f"{xml_path} was re-parsed instead of read from cache")
+
+
 class TestFIX44XMLLoader:
     """Tests for FIX44.xml loading."""
 
@@ -38,6 +51,10 @@ class TestFIX44XMLLoader:
         side = fields_by_tag[54]
         assert "1" in side.valid_values  # Buy
         assert "2" in side.valid_values  # Sell
+        # Enum rows load straight into a code -> description dict
+        assert side.valid_values["1"] == "BUY"
+        assert side.get_value_description("1") == "BUY"
+        assert side.get_value_description("ZZ") is None
 
     def test_loads_field_types(self) -> None:
         """Test that field types are correctly parsed."""
@@ -114,3 +131,111 @@ class TestLoadFixSpecFields:
         """Test backward compatibility: load_fix44_fields() still returns fields."""
         fields = load_fix44_fields()
         assert len(fields) > 0
+
+    def test_writes_and_reuses_pickle_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A parsed spec is pickled into the cache directory, not next to the
+        XML, and read back from there by a new process."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("FXFIXPARSER_CACHE_DIR", str(cache_dir))
+        xml_dir = tmp_path / "spec"
+        xml_dir.mkdir()
+        xml_path = xml_dir / "spec.xml"
+        xml_path.write_text(
+            '<fix><fields><field number="54" name="Side" type="CHAR">'
+            '<value enum="1" description="BUY"/></field></fields></fix>'
+        )
+
+        fields = load_fix_spec_fields(xml_path)
+        assert [p.name for p in xml_dir.iterdir()] == ["spec.xml"]
+        assert len(list(cache_dir.glob("spec-*.pkl"))) == 1
+
+        # Clear the in-process memo so the next load has to go to disk.
+        _load_spec_fields_cached.cache_clear()
+        monkeypatch.setattr(loader, "_parse_spec_xml", _fail_parse)
+        assert load_fix_spec_fields(xml_path) == fields
+
+    def test_warm_cache_definitions_are_interned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Definitions read back from the pickle share interned strings, just
+        like ones parsed from the XML."""
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text(
+            '<fix><fields><field number="54" name="Side" type="CHAR">'
+            '<value enum="1" description="BUY"/></field></fields></fix>'
+        )
+        load_fix_spec_fields(xml_path)
+
+        _load_spec_fields_cached.cache_clear()
+        monkeypatch.setattr(loader, "_parse_spec_xml", _fail_parse)
+        (side,) = load_fix_spec_fields(xml_path)
+
+        assert side.name is sys.intern("Side")
+        assert side.field_type is sys.intern("CHAR")
+        ((code, description),) = side.valid_values.items()
+        assert code is sys.intern("1")
+        assert description is sys.intern("BUY")
+
+    def test_edited_xml_is_reparsed(self, tmp_path: Path) -> None:
+        """Changing the XML keys a new cache entry, so it is re-parsed."""
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text('<fix><fields><field number="54" name="Side"/></fields></fix>')
+        load_fix_spec_fields(xml_path)
+
+        _load_spec_fields_cached.cache_clear()
+        xml_path.write_text('<fix><fields><field number="55" name="Symbol"/></fields></fix>')
+        assert [f.tag for f in load_fix_spec_fields(xml_path)] == [55]
+
+    def test_rewriting_cache_removes_older_pickles(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A new cache entry replaces older ones for the same spec only."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv("FXFIXPARSER_CACHE_DIR", str(cache_dir))
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text('<fix><fields><field number="54" name="Side"/></fields></fix>')
+        load_fix_spec_fields(xml_path)
+        first = loader._pickle_cache_path(xml_path)
+        other_spec = cache_dir / f"spec-v2-{'0' * 32}.pkl"
+        other_spec.write_bytes(b"")
+
+        _load_spec_fields_cached.cache_clear()
+        xml_path.write_text('<fix><fields><field number="55" name="Symbol"/></fields></fix>')
+        load_fix_spec_fields(xml_path)
+
+        assert not first.exists()
+        assert sorted(cache_dir.iterdir()) == sorted(
+            [loader._pickle_cache_path(xml_path), other_spec]
+        )
+
+    def test_pickle_from_other_code_version_is_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A pickle written under another loader/field fingerprint is not read."""
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text('<fix><fields><field number="54" name="Side"/></fields></fix>')
+        load_fix_spec_fields(xml_path)
+
+        _load_spec_fields_cached.cache_clear()
+        monkeypatch.setattr(loader, "_code_fingerprint", lambda: "other-version")
+        assert loader._read_pickle_cache(xml_path) is None
+
+    def test_only_top_level_fields_section_is_read(self, tmp_path: Path) -> None:
+        """<field> references inside messages are not taken as definitions."""
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text(
+            '<fix><messages><message name="Order">'
+            '<field name="Side" required="Y" number="999"/></message></messages>'
+            '<fields><field number="54" name="Side" type="CHAR"/></fields></fix>'
+        )
+
+        assert [f.tag for f in load_fix_spec_fields(xml_path)] == [54]
+
+    def test_spec_without_fields_section_returns_empty(self, tmp_path: Path) -> None:
+        """A spec with no <fields> section yields no definitions."""
+        xml_path = tmp_path / "spec.xml"
+        xml_path.write_text("<fix><messages/></fix>")
+
+        assert load_fix_spec_fields(xml_path) == []
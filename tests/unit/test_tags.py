@@ -1,9 +1,26 @@
 """Unit tests for tag dictionary."""
 
+import pytest
+
 from fxfixparser.core.field import FixFieldDefinition
+from fxfixparser.core.parser import FixParser
 from fxfixparser.tags.dictionary import TagDictionary
-from fxfixparser.tags.fix44 import FIX44_TAGS
-from fxfixparser.tags.fx_tags import FX_CUSTOM_TAGS
+from fxfixparser.tags.fix44 import FIX44_TAGS, FIX44_TAGS_BY_NUMBER
+from fxfixparser.tags.fx_tags import FX_CUSTOM_TAGS, FX_CUSTOM_TAGS_BY_NUMBER, LFX_TENOR_VALUES
+from fxfixparser.venues.registry import VenueRegistry
+from fxfixparser.venues.smart_trade import SmartTradeHandler
+
+
+@pytest.fixture(scope="module")
+def st_handler() -> SmartTradeHandler:
+    """Create one Smart Trade handler for the module."""
+    return SmartTradeHandler()
+
+
+@pytest.fixture(scope="module")
+def st_tags_by_number(st_handler: SmartTradeHandler) -> dict[int, FixFieldDefinition]:
+    """Index the Smart Trade custom tags by tag number once per module."""
+    return {t.tag: t for t in st_handler.custom_tags}
 
 
 class TestTagDictionary:
@@ -27,6 +44,14 @@ class TestTagDictionary:
         assert d.get(55) == defn
         assert d.get_name(55) == "Symbol"
 
+    def test_contains(self) -> None:
+        """Test membership checks with the in operator."""
+        d = TagDictionary()
+        d.add(FixFieldDefinition(tag=55, name="Symbol"))
+
+        assert 55 in d
+        assert 54 not in d
+
     def test_all_tags(self) -> None:
         """Test getting all tag numbers."""
         d = TagDictionary()
@@ -36,6 +61,11 @@ class TestTagDictionary:
         tags = d.all_tags()
         assert 8 in tags
         assert 35 in tags
+        assert d.all_tags() is tags
+
+        d.add(FixFieldDefinition(tag=55, name="Symbol"))
+        assert d.all_tags() == {8, 35, 55}
+        assert 55 not in tags
 
     def test_merge_dictionaries(self) -> None:
         """Test merging two dictionaries."""
@@ -49,6 +79,31 @@ class TestTagDictionary:
 
         assert d1.has_tag(8)
         assert d1.has_tag(35)
+        assert d1.get_name(35) == "MsgType"
+
+    def test_merge_overrides_existing_definitions(self) -> None:
+        """Test merged definitions replace existing ones for the same tag."""
+        d1 = TagDictionary()
+        d1.add(FixFieldDefinition(tag=55, name="Symbol"))
+        d2 = TagDictionary()
+        d2.add(FixFieldDefinition(tag=55, name="CurrencyPair"))
+
+        d1.merge(d2)
+
+        assert d1.get_name(55) == "CurrencyPair"
+        assert d1.all_tags() == {55}
+
+    def test_from_definitions_later_entries_win(self) -> None:
+        """Test building a dictionary in one pass keeps add() override order."""
+        d = TagDictionary.from_definitions(
+            [
+                FixFieldDefinition(tag=55, name="Symbol"),
+                FixFieldDefinition(tag=55, name="CurrencyPair"),
+            ]
+        )
+
+        assert d.get_name(55) == "CurrencyPair"
+        assert d.all_tags() == {55}
 
     def test_default_dictionary(self, tag_dictionary: TagDictionary) -> None:
         """Test default dictionary contains standard tags."""
@@ -85,10 +140,11 @@ class TestFIX44Tags:
     def test_fix44_tags_not_empty(self) -> None:
         """Test FIX 4.4 tags list is not empty."""
         assert len(FIX44_TAGS) > 0
+        assert len(FIX44_TAGS_BY_NUMBER) == len(FIX44_TAGS)
 
     def test_required_header_tags(self) -> None:
         """Test required header tags are defined."""
-        tag_numbers = {t.tag for t in FIX44_TAGS}
+        tag_numbers = FIX44_TAGS_BY_NUMBER
 
         assert 8 in tag_numbers  # BeginString
         assert 9 in tag_numbers  # BodyLength
@@ -98,7 +154,7 @@ class TestFIX44Tags:
 
     def test_trailer_tag(self) -> None:
         """Test trailer tag is defined."""
-        tag_numbers = {t.tag for t in FIX44_TAGS}
+        tag_numbers = FIX44_TAGS_BY_NUMBER
         assert 10 in tag_numbers  # CheckSum
 
 
@@ -111,14 +167,14 @@ class TestFXCustomTags:
 
     def test_options_tags(self) -> None:
         """Test options-related tags are defined."""
-        tag_numbers = {t.tag for t in FX_CUSTOM_TAGS}
+        tag_numbers = FX_CUSTOM_TAGS_BY_NUMBER
 
         assert 201 in tag_numbers  # PutOrCall
         assert 202 in tag_numbers  # StrikePrice
 
     def test_forward_md_entry_tags(self) -> None:
         """Test forward market data entry tags 1026/1027 are defined."""
-        tag_numbers = {t.tag: t for t in FX_CUSTOM_TAGS}
+        tag_numbers = FX_CUSTOM_TAGS_BY_NUMBER
 
         assert 1026 in tag_numbers
         assert tag_numbers[1026].name == "MDEntrySpotRate"
@@ -129,42 +185,90 @@ class TestFXCustomTags:
         assert tag_numbers[1027].field_type == "PRICEOFFSET"
 
 
+# (tag, name, field_type) for each Smart Trade custom tag, per the LFX spec.
+_SMART_TRADE_EXPECTED_TAGS = [
+    # MassQuote entry IDs
+    (8000, "BidEntryID", "STRING"),
+    (8001, "OfferEntryID", "STRING"),
+    # Far leg spot rates, sizes and all-in prices
+    (8011, "BidSpotRate2", "PRICE"),
+    (8012, "OfferSpotRate2", "PRICE"),
+    (8013, "BidSize2", "QTY"),
+    (8014, "OfferSize2", "QTY"),
+    (8019, "BidPx2", "PRICE"),
+    (8020, "OfferPx2", "PRICE"),
+    # Settlement dates (near and far leg)
+    (8015, "BidSettlDate", "LOCALMKTDATE"),
+    (8016, "BidSettlDate2", "LOCALMKTDATE"),
+    (8017, "OfferSettlDate", "LOCALMKTDATE"),
+    (8018, "OfferSettlDate2", "LOCALMKTDATE"),
+    # Quote currencies
+    (8021, "BidCurrency", "CURRENCY"),
+    (8022, "OfferCurrency", "CURRENCY"),
+    # Swap points
+    (1065, "BidSwapPoints", "PRICEOFFSET"),
+    (1066, "OfferSwapPoints", "PRICEOFFSET"),
+    # Market data
+    (9000, "NoRequestedSize", "NUMINGROUP"),
+    (9001, "RequestedSize", "QTY"),
+    (9122, "MDEntryOrigTime", "UTCTIMEONLY"),
+    # Execution report far leg
+    (9044, "MaturityDate2", "LOCALMKTDATE"),
+    (9091, "LastPx2", "PRICE"),
+    (9092, "LastQty2", "QTY"),
+    (9093, "LeavesQty2", "QTY"),
+    (9094, "CumQty2", "QTY"),
+    (9095, "LastSpotRate2", "PRICE"),
+    # Fixing orders
+    (9300, "FixingSourceID", "STRING"),
+    (9301, "FixingTime", "UTCTIMESTAMP"),
+    # UTI
+    (10002, "UTIPrefix", "STRING"),
+    (10003, "UTI", "STRING"),
+    (10011, "IsSEFTrade", "BOOLEAN"),
+    # Allocations
+    (11001, "RequestType", "CHAR"),
+    (11003, "AllocationID", "STRING"),
+    (11078, "C_NoAllocs", "NUMINGROUP"),
+    (11079, "C_AllocAccount", "STRING"),
+    (11080, "C_AllocQty", "QTY"),
+    # Forward rolls
+    (9011, "ClRootOrderID", "STRING"),
+]
+
+
 class TestSmartTradeVendorTags:
     """Tests for Smart Trade (LiquidityFX) vendor-specific tags."""
 
-    def test_smart_trade_custom_tags_not_empty(self) -> None:
+    def test_smart_trade_custom_tags_not_empty(self, st_handler: SmartTradeHandler) -> None:
         """Test Smart Trade handler has custom tags defined."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        assert len(handler.custom_tags) > 0
-
-    def test_8xxx_mass_quote_entry_ids(self) -> None:
-        """Test 8000-8001 MassQuote entry ID tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8000 - BidEntryID
-        assert 8000 in tags_by_number
-        assert tags_by_number[8000].name == "BidEntryID"
-        assert tags_by_number[8000].field_type == "STRING"
-
-        # 8001 - OfferEntryID
-        assert 8001 in tags_by_number
-        assert tags_by_number[8001].name == "OfferEntryID"
-        assert tags_by_number[8001].field_type == "STRING"
-
-    def test_8004_far_leg_tenor(self) -> None:
+        assert len(st_handler.custom_tags) > 0
+
+    def test_get_custom_tag(self, st_handler: SmartTradeHandler) -> None:
+        """Test direct lookup of a Smart Trade custom tag by number."""
+        assert {t.tag for t in st_handler.custom_tags} >= {8000, 8004, 11654}
+        defn = st_handler.get_custom_tag(8004)
+        assert defn is not None
+        assert defn.name == "SettlType2"
+        assert st_handler.get_custom_tag(8005) is None
+
+    @pytest.mark.parametrize("tag,name,field_type", _SMART_TRADE_EXPECTED_TAGS)
+    def test_smart_trade_tag_definition(
+        self,
+        st_tags_by_number: dict[int, FixFieldDefinition],
+        tag: int,
+        name: str,
+        field_type: str,
+    ) -> None:
+        """Test each Smart Trade custom tag's name and type per LFX spec."""
+        assert tag in st_tags_by_number
+        assert st_tags_by_number[tag].name == name
+        assert st_tags_by_number[tag].field_type == field_type
+
+    def test_8004_far_leg_tenor(self, st_tags_by_number: dict[int, FixFieldDefinition]) -> None:
         """Test 8004 SettlType2 (Far Leg Tenor) tag per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        assert 8004 in tags_by_number
-        tag = tags_by_number[8004]
+        assert 8004 in st_tags_by_number
+        tag = st_tags_by_number[8004]
         assert tag.name == "SettlType2"
         assert tag.field_type == "STRING"
 
@@ -175,199 +279,10 @@ class TestSmartTradeVendorTags:
         assert "M1" in tag.valid_values  # 1 Month
         assert "Y1" in tag.valid_values  # 1 Year
 
-    def test_8xxx_spot_rates(self) -> None:
-        """Test 8011-8012 spot rate tags for far leg per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8011 - BidSpotRate2 (far leg bid spot rate)
-        assert 8011 in tags_by_number
-        assert tags_by_number[8011].name == "BidSpotRate2"
-        assert tags_by_number[8011].field_type == "PRICE"
-
-        # 8012 - OfferSpotRate2 (far leg offer spot rate)
-        assert 8012 in tags_by_number
-        assert tags_by_number[8012].name == "OfferSpotRate2"
-        assert tags_by_number[8012].field_type == "PRICE"
-
-    def test_8xxx_sizes(self) -> None:
-        """Test 8013-8014 size tags for far leg per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8013 - BidSize2
-        assert 8013 in tags_by_number
-        assert tags_by_number[8013].name == "BidSize2"
-        assert tags_by_number[8013].field_type == "QTY"
-
-        # 8014 - OfferSize2
-        assert 8014 in tags_by_number
-        assert tags_by_number[8014].name == "OfferSize2"
-        assert tags_by_number[8014].field_type == "QTY"
-
-    def test_8xxx_settlement_dates(self) -> None:
-        """Test 8015-8018 settlement date tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8015 - BidSettlDate (near leg)
-        assert 8015 in tags_by_number
-        assert tags_by_number[8015].name == "BidSettlDate"
-        assert tags_by_number[8015].field_type == "LOCALMKTDATE"
-
-        # 8016 - BidSettlDate2 (far leg)
-        assert 8016 in tags_by_number
-        assert tags_by_number[8016].name == "BidSettlDate2"
-        assert tags_by_number[8016].field_type == "LOCALMKTDATE"
-
-        # 8017 - OfferSettlDate (near leg)
-        assert 8017 in tags_by_number
-        assert tags_by_number[8017].name == "OfferSettlDate"
-        assert tags_by_number[8017].field_type == "LOCALMKTDATE"
-
-        # 8018 - OfferSettlDate2 (far leg)
-        assert 8018 in tags_by_number
-        assert tags_by_number[8018].name == "OfferSettlDate2"
-        assert tags_by_number[8018].field_type == "LOCALMKTDATE"
-
-    def test_8xxx_all_in_prices(self) -> None:
-        """Test 8019-8020 all-in price tags for far leg per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8019 - BidPx2 (far leg all-in bid price)
-        assert 8019 in tags_by_number
-        assert tags_by_number[8019].name == "BidPx2"
-        assert tags_by_number[8019].field_type == "PRICE"
-
-        # 8020 - OfferPx2 (far leg all-in offer price)
-        assert 8020 in tags_by_number
-        assert tags_by_number[8020].name == "OfferPx2"
-        assert tags_by_number[8020].field_type == "PRICE"
-
-    def test_8xxx_currencies(self) -> None:
-        """Test 8021-8022 currency tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 8021 - BidCurrency
-        assert 8021 in tags_by_number
-        assert tags_by_number[8021].name == "BidCurrency"
-        assert tags_by_number[8021].field_type == "CURRENCY"
-
-        # 8022 - OfferCurrency
-        assert 8022 in tags_by_number
-        assert tags_by_number[8022].name == "OfferCurrency"
-        assert tags_by_number[8022].field_type == "CURRENCY"
-
-    def test_swap_points_tags(self) -> None:
-        """Test 1065-1066 swap points tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 1065 - BidSwapPoints
-        assert 1065 in tags_by_number
-        assert tags_by_number[1065].name == "BidSwapPoints"
-        assert tags_by_number[1065].field_type == "PRICEOFFSET"
-
-        # 1066 - OfferSwapPoints
-        assert 1066 in tags_by_number
-        assert tags_by_number[1066].name == "OfferSwapPoints"
-        assert tags_by_number[1066].field_type == "PRICEOFFSET"
-
-    def test_9xxx_market_data_tags(self) -> None:
-        """Test 9xxx range market data tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 9000 - NoRequestedSize
-        assert 9000 in tags_by_number
-        assert tags_by_number[9000].name == "NoRequestedSize"
-        assert tags_by_number[9000].field_type == "NUMINGROUP"
-
-        # 9001 - RequestedSize
-        assert 9001 in tags_by_number
-        assert tags_by_number[9001].name == "RequestedSize"
-        assert tags_by_number[9001].field_type == "QTY"
-
-        # 9122 - MDEntryOrigTime
-        assert 9122 in tags_by_number
-        assert tags_by_number[9122].name == "MDEntryOrigTime"
-        assert tags_by_number[9122].field_type == "UTCTIMEONLY"
-
-    def test_9xxx_execution_report_tags(self) -> None:
-        """Test 9xxx execution report tags for swaps per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 9044 - MaturityDate2 (NDS far leg fixing date)
-        assert 9044 in tags_by_number
-        assert tags_by_number[9044].name == "MaturityDate2"
-
-        # 9091 - LastPx2 (swap far leg fill price)
-        assert 9091 in tags_by_number
-        assert tags_by_number[9091].name == "LastPx2"
-        assert tags_by_number[9091].field_type == "PRICE"
-
-        # 9092 - LastQty2 (swap far leg fill quantity)
-        assert 9092 in tags_by_number
-        assert tags_by_number[9092].name == "LastQty2"
-        assert tags_by_number[9092].field_type == "QTY"
-
-        # 9093 - LeavesQty2 (swap far leg open quantity)
-        assert 9093 in tags_by_number
-        assert tags_by_number[9093].name == "LeavesQty2"
-
-        # 9094 - CumQty2 (swap far leg cumulative filled)
-        assert 9094 in tags_by_number
-        assert tags_by_number[9094].name == "CumQty2"
-
-        # 9095 - LastSpotRate2 (swap far leg spot rate)
-        assert 9095 in tags_by_number
-        assert tags_by_number[9095].name == "LastSpotRate2"
-
-    def test_9xxx_fixing_tags(self) -> None:
-        """Test 9300-9301 fixing order tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 9300 - FixingSourceID
-        assert 9300 in tags_by_number
-        assert tags_by_number[9300].name == "FixingSourceID"
-        assert tags_by_number[9300].field_type == "STRING"
-
-        # 9301 - FixingTime
-        assert 9301 in tags_by_number
-        assert tags_by_number[9301].name == "FixingTime"
-        assert tags_by_number[9301].field_type == "UTCTIMESTAMP"
-
-    def test_9400_regulation_type(self) -> None:
+    def test_9400_regulation_type(self, st_tags_by_number: dict[int, FixFieldDefinition]) -> None:
         """Test 9400 RegulationType tag with enumerated values per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        assert 9400 in tags_by_number
-        tag = tags_by_number[9400]
+        assert 9400 in st_tags_by_number
+        tag = st_tags_by_number[9400]
         assert tag.name == "RegulationType"
         assert tag.field_type == "STRING"
 
@@ -381,66 +296,18 @@ class TestSmartTradeVendorTags:
         assert "Swap Execution Facility" in tag.get_value_description("SEF")
         assert "Multilateral Trading Facility" in tag.get_value_description("MTF")
 
-    def test_10xxx_uti_tags(self) -> None:
-        """Test 10xxx UTI (Unique Trade Identifier) tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
+    def test_11001_request_type_enumerated_values(
+        self, st_tags_by_number: dict[int, FixFieldDefinition]
+    ) -> None:
+        """Test 11001 RequestType enumerated values per LFX spec."""
+        assert "M" in st_tags_by_number[11001].valid_values
 
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 10002 - UTIPrefix
-        assert 10002 in tags_by_number
-        assert tags_by_number[10002].name == "UTIPrefix"
-
-        # 10003 - UTI
-        assert 10003 in tags_by_number
-        assert tags_by_number[10003].name == "UTI"
-
-        # 10011 - IsSEFTrade
-        assert 10011 in tags_by_number
-        assert tags_by_number[10011].name == "IsSEFTrade"
-        assert tags_by_number[10011].field_type == "BOOLEAN"
-
-    def test_11xxx_allocation_tags(self) -> None:
-        """Test 11xxx allocation tags per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        # 11001 - RequestType
-        assert 11001 in tags_by_number
-        assert tags_by_number[11001].name == "RequestType"
-        assert tags_by_number[11001].valid_values is not None
-        assert "M" in tags_by_number[11001].valid_values
-
-        # 11003 - AllocationID
-        assert 11003 in tags_by_number
-        assert tags_by_number[11003].name == "AllocationID"
-
-        # 11078 - C_NoAllocs
-        assert 11078 in tags_by_number
-        assert tags_by_number[11078].name == "C_NoAllocs"
-        assert tags_by_number[11078].field_type == "NUMINGROUP"
-
-        # 11079 - C_AllocAccount
-        assert 11079 in tags_by_number
-        assert tags_by_number[11079].name == "C_AllocAccount"
-
-        # 11080 - C_AllocQty
-        assert 11080 in tags_by_number
-        assert tags_by_number[11080].name == "C_AllocQty"
-        assert tags_by_number[11080].field_type == "QTY"
-
-    def test_11054_alloc_side_enumerated_values(self) -> None:
+    def test_11054_alloc_side_enumerated_values(
+        self, st_tags_by_number: dict[int, FixFieldDefinition]
+    ) -> None:
         """Test 11054 C_AllocSide enumerated values per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
-
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
-
-        assert 11054 in tags_by_number
-        tag = tags_by_number[11054]
+        assert 11054 in st_tags_by_number
+        tag = st_tags_by_number[11054]
         assert tag.name == "C_AllocSide"
 
         assert tag.valid_values is not None
@@ -450,8 +317,6 @@ class TestSmartTradeVendorTags:
 
     def test_lfx_tenor_values_complete(self) -> None:
         """Test LFX_TENOR_VALUES dictionary has all required tenors."""
-        from fxfixparser.tags.fx_tags import LFX_TENOR_VALUES
-
         # Standard tenors from section 11.9 of LFX spec
         # Format: SPOT, TOD, TOM, ONI (overnight), SNX (spot next), TNX (tom next)
         # Weeks: W1, W2, W3
@@ -484,42 +349,52 @@ class TestSmartTradeVendorTags:
             "Y3",
         ]
 
-        for tenor in required_tenors:
-            assert tenor in LFX_TENOR_VALUES, f"Missing tenor: {tenor}"
+        missing = set(required_tenors) - LFX_TENOR_VALUES.keys()
+        assert not missing, f"Missing tenors: {sorted(missing)}"
+
 
-    def test_forward_roll_tag(self) -> None:
-        """Test 9011 ClRootOrderID for forward rolls per LFX spec."""
-        from fxfixparser.venues.smart_trade import SmartTradeHandler
+# Smart Trade messages for the parsing tests, SOH-delimited as on the wire.
+_MSG_8XXX = (
+    "8=FIX.4.4\x019=250\x0135=S\x0149=LFX\x0156=CLIENT\x0155=EUR/USD\x01"
+    "8000=BID123\x018001=OFF456\x018004=M1\x018011=1.0850\x018012=1.0855\x01"
+    "8013=1000000\x018014=1000000\x018015=20240117\x018016=20240217\x01"
+    "8017=20240117\x018018=20240217\x018019=1.0900\x018020=1.0905\x018021=EUR\x01"
+    "8022=EUR\x0110=123\x01"
+)
 
-        handler = SmartTradeHandler()
-        tags_by_number = {t.tag: t for t in handler.custom_tags}
+_MSG_9XXX = (
+    "8=FIX.4.4\x019=200\x0135=8\x0149=LFX_CORE\x0156=CLIENT\x0155=EUR/USD\x01"
+    "9091=1.0900\x019092=500000\x019093=500000\x019094=500000\x019095=1.0850\x01"
+    "9300=WMR\x019301=20240115-16:00:00.000\x019400=MTF\x0110=123\x01"
+)
 
-        assert 9011 in tags_by_number
-        assert tags_by_number[9011].name == "ClRootOrderID"
-        assert tags_by_number[9011].field_type == "STRING"
+_MSG_ALLOCATION = (
+    "8=FIX.4.4\x019=200\x0135=R\x0149=SMARTTRADE\x0156=CLIENT\x0155=EUR/USD\x01"
+    "11001=M\x0111003=ALLOC001\x0111078=2\x0111079=ACCT1\x0111080=500000\x01"
+    "11054=B\x0111079=ACCT2\x0111080=500000\x0111054=C\x0110=123\x01"
+)
+
+_MSG_HUMAN_READABLE = (
+    "8=FIX.4.4\x019=100\x0135=S\x0149=LFX\x0156=CLIENT\x0155=EUR/USD\x018004=SPOT\x01"
+    "8021=EUR\x019400=SEF\x0110=123\x01"
+)
+
+_MSG_TO_DICT = (
+    "8=FIX.4.4\x019=100\x0135=S\x0149=LFX\x0156=CLIENT\x0155=EUR/USD\x01"
+    "8000=BID123\x018004=M1\x0110=123\x01"
+)
 
 
 class TestVendorTagParsing:
     """Tests for parsing messages with vendor-specific tags."""
 
-    def test_parse_message_with_8xxx_tags(self) -> None:
+    def test_parse_message_with_8xxx_tags(
+        self, shared_parser: FixParser, shared_venues: VenueRegistry
+    ) -> None:
         """Test parsing a FIX message containing Smart Trade 8xxx tags."""
-        from fxfixparser.core.parser import FixParser, ParserConfig
-        from fxfixparser.venues.registry import VenueRegistry
-
-        msg = (
-            "8=FIX.4.4|9=250|35=S|49=LFX|56=CLIENT|55=EUR/USD|"
-            "8000=BID123|8001=OFF456|8004=M1|"
-            "8011=1.0850|8012=1.0855|8013=1000000|8014=1000000|"
-            "8015=20240117|8016=20240217|8017=20240117|8018=20240217|"
-            "8019=1.0900|8020=1.0905|8021=EUR|8022=EUR|10=123|"
-        )
-
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(msg)
+        message = shared_parser.parse(_MSG_8XXX)
 
-        venue_registry = VenueRegistry.default()
-        handler = venue_registry.get_by_sender_id("LFX")
+        handler = shared_venues.get_by_sender_id("LFX")
         assert handler is not None
         message = handler.enhance_message(message)
 
@@ -537,22 +412,13 @@ class TestVendorTagParsing:
         assert message.get_field(8019).name == "BidPx2"
         assert message.get_field(8021).name == "BidCurrency"
 
-    def test_parse_message_with_9xxx_tags(self) -> None:
+    def test_parse_message_with_9xxx_tags(
+        self, shared_parser: FixParser, shared_venues: VenueRegistry
+    ) -> None:
         """Test parsing a FIX message containing Smart Trade 9xxx tags."""
-        from fxfixparser.core.parser import FixParser, ParserConfig
-        from fxfixparser.venues.registry import VenueRegistry
-
-        msg = (
-            "8=FIX.4.4|9=200|35=8|49=LFX_CORE|56=CLIENT|55=EUR/USD|"
-            "9091=1.0900|9092=500000|9093=500000|9094=500000|9095=1.0850|"
-            "9300=WMR|9301=20240115-16:00:00.000|9400=MTF|10=123|"
-        )
-
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(msg)
+        message = shared_parser.parse(_MSG_9XXX)
 
-        venue_registry = VenueRegistry.default()
-        handler = venue_registry.get_by_sender_id("LFX_CORE")
+        handler = shared_venues.get_by_sender_id("LFX_CORE")
         assert handler is not None
         message = handler.enhance_message(message)
 
@@ -564,23 +430,13 @@ class TestVendorTagParsing:
         assert message.get_field(9400).name == "RegulationType"
         assert message.get_field(9400).raw_value == "MTF"
 
-    def test_parse_message_with_allocation_tags(self) -> None:
+    def test_parse_message_with_allocation_tags(
+        self, shared_parser: FixParser, shared_venues: VenueRegistry
+    ) -> None:
         """Test parsing a FIX message containing Smart Trade 11xxx allocation tags."""
-        from fxfixparser.core.parser import FixParser, ParserConfig
-        from fxfixparser.venues.registry import VenueRegistry
-
-        msg = (
-            "8=FIX.4.4|9=200|35=R|49=SMARTTRADE|56=CLIENT|55=EUR/USD|"
-            "11001=M|11003=ALLOC001|11078=2|"
-            "11079=ACCT1|11080=500000|11054=B|"
-            "11079=ACCT2|11080=500000|11054=C|10=123|"
-        )
-
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(msg)
+        message = shared_parser.parse(_MSG_ALLOCATION)
 
-        venue_registry = VenueRegistry.default()
-        handler = venue_registry.get_by_sender_id("SMARTTRADE")
+        handler = shared_venues.get_by_sender_id("SMARTTRADE")
         assert handler is not None
         message = handler.enhance_message(message)
 
@@ -590,21 +446,13 @@ class TestVendorTagParsing:
         assert message.get_field(11003).name == "AllocationID"
         assert message.get_field(11078).name == "C_NoAllocs"
 
-    def test_vendor_tag_to_human_readable(self) -> None:
+    def test_vendor_tag_to_human_readable(
+        self, shared_parser: FixParser, shared_venues: VenueRegistry
+    ) -> None:
         """Test vendor-specific tags render correctly in human readable format."""
-        from fxfixparser.core.parser import FixParser, ParserConfig
-        from fxfixparser.venues.registry import VenueRegistry
-
-        msg = (
-            "8=FIX.4.4|9=100|35=S|49=LFX|56=CLIENT|55=EUR/USD|"
-            "8004=SPOT|8021=EUR|9400=SEF|10=123|"
-        )
+        message = shared_parser.parse(_MSG_HUMAN_READABLE)
 
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(msg)
-
-        venue_registry = VenueRegistry.default()
-        handler = venue_registry.get_by_sender_id("LFX")
+        handler = shared_venues.get_by_sender_id("LFX")
         message = handler.enhance_message(message)
 
         output = message.to_human_readable()
@@ -614,29 +462,23 @@ class TestVendorTagParsing:
         assert "BidCurrency (8021)" in output
         assert "RegulationType (9400)" in output
 
-    def test_vendor_tag_to_dict(self) -> None:
+    def test_vendor_tag_to_dict(
+        self, shared_parser: FixParser, shared_venues: VenueRegistry
+    ) -> None:
         """Test vendor-specific tags are included in dict output."""
-        from fxfixparser.core.parser import FixParser, ParserConfig
-        from fxfixparser.venues.registry import VenueRegistry
-
-        msg = "8=FIX.4.4|9=100|35=S|49=LFX|56=CLIENT|55=EUR/USD|" "8000=BID123|8004=M1|10=123|"
-
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(msg)
+        message = shared_parser.parse(_MSG_TO_DICT)
 
-        venue_registry = VenueRegistry.default()
-        handler = venue_registry.get_by_sender_id("LFX")
+        handler = shared_venues.get_by_sender_id("LFX")
         message = handler.enhance_message(message)
 
         d = message.to_dict()
 
-        # Find vendor-specific tags in the output
-        tag_8000 = next((f for f in d["fields"] if f["tag"] == 8000), None)
-        assert tag_8000 is not None
-        assert tag_8000["name"] == "BidEntryID"
-        assert tag_8000["value"] == "BID123"
+        # Index the output by tag once, then look vendor tags up directly
+        fields_by_tag = {f["tag"]: f for f in d["fields"]}
+        assert 8000 in fields_by_tag
+        assert fields_by_tag[8000]["name"] == "BidEntryID"
+        assert fields_by_tag[8000]["value"] == "BID123"
 
-        tag_8004 = next((f for f in d["fields"] if f["tag"] == 8004), None)
-        assert tag_8004 is not None
-        assert tag_8004["name"] == "SettlType2"
-        assert tag_8004["value"] == "M1"
+        assert 8004 in fields_by_tag
+        assert fields_by_tag[8004]["name"] == "SettlType2"
+        assert fields_by_tag[8004]["value"] == "M1"
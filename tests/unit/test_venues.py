@@ -1,11 +1,15 @@
 """Unit tests for venue handlers."""
 
-from typing import Mapping
+import copy
+from typing import Iterable, Mapping
+
+import pytest
 
 from fxfixparser.core.field import FixField
 from fxfixparser.core.message import FixMessage, ParsedTrade
 from fxfixparser.core.parser import FixParser, ParserConfig
 from fxfixparser.products.base import ProductRegistry
+from fxfixparser.venues.base import VenueHandler
 from fxfixparser.venues.bloomberg_dor import BloombergDORHandler
 from fxfixparser.venues.fxgo import FXGOHandler
 from fxfixparser.venues.registry import VenueRegistry
@@ -15,19 +19,27 @@ from tests.fixtures.sample_messages import (
     BLOOMBERG_DOR_GENERIC_COMPID_EXEC,
     BLOOMBERG_DOR_SPOT_EXEC,
     BLOOMBERG_DOR_SPOT_RFQ,
-    FORWARD_MESSAGE,
     SIMPLE_MESSAGE,
-    SPOT_MESSAGE_PIPE,
-    SWAP_MESSAGE,
 )
 
+# Handlers are stateless, so one instance of each serves every test.
+_FXGO = FXGOHandler()
+_SMART_TRADE = SmartTradeHandler()
+_THREE_SIXTY_T = ThreeSixtyTHandler()
+_BLOOMBERG_DOR = BloombergDORHandler()
+
+
+def _attrs(obj: object, names: Iterable[str]) -> dict[str, object]:
+    """Return ``{name: getattr(obj, name)}`` so one assert shows every mismatch."""
+    return {name: getattr(obj, name) for name in names}
+
 
 class TestVenueHandlers:
     """Tests for individual venue handlers."""
 
     def test_fxgo_handler_properties(self) -> None:
         """Test FXGO handler properties."""
-        handler = FXGOHandler()
+        handler = _FXGO
 
         assert handler.name == "Bloomberg FXGO"
         assert "FXGO" in handler.sender_comp_ids
@@ -35,7 +47,7 @@ class TestVenueHandlers:
 
     def test_smart_trade_handler_properties(self) -> None:
         """Test Smart Trade handler properties."""
-        handler = SmartTradeHandler()
+        handler = _SMART_TRADE
 
         assert handler.name == "Smart Trade (LiquidityFX)"
         assert "SMARTTRADE" in handler.sender_comp_ids
@@ -43,24 +55,25 @@ class TestVenueHandlers:
 
     def test_three_sixty_t_handler_properties(self) -> None:
         """Test 360T handler properties."""
-        handler = ThreeSixtyTHandler()
+        handler = _THREE_SIXTY_T
 
         assert handler.name == "360T RFS"
         assert "360T" in handler.sender_comp_ids
 
     def test_fxgo_matches_sender(self) -> None:
         """Test FXGO sender matching."""
-        handler = FXGOHandler()
+        handler = _FXGO
 
         assert handler.matches_sender("FXGO")
         assert handler.matches_sender("fxgo")
+        assert handler.matches_sender("bFxGo")
         assert handler.matches_sender("BLOOMBERG")
         assert not handler.matches_sender("360T")
         assert not handler.matches_sender(None)
 
     def test_smart_trade_matches_sender(self) -> None:
         """Test Smart Trade sender matching including all sender IDs."""
-        handler = SmartTradeHandler()
+        handler = _SMART_TRADE
 
         assert handler.matches_sender("SMARTTRADE")
         assert handler.matches_sender("smarttrade")
@@ -74,7 +87,7 @@ class TestVenueHandlers:
 
     def test_three_sixty_t_matches_sender(self) -> None:
         """Test 360T sender matching with all sender IDs."""
-        handler = ThreeSixtyTHandler()
+        handler = _THREE_SIXTY_T
 
         assert handler.matches_sender("360T")
         assert handler.matches_sender("360t")
@@ -85,83 +98,86 @@ class TestVenueHandlers:
         assert not handler.matches_sender("FXGO")
         assert not handler.matches_sender(None)
 
-    def test_extract_trade_fxgo(self) -> None:
-        """Test trade extraction from FXGO execution report."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(SPOT_MESSAGE_PIPE)
-
-        handler = FXGOHandler()
-        trade = handler.extract_trade(message)
-
-        assert trade.symbol == "EUR/USD"
-        assert trade.side == "Buy"
-        assert trade.quantity == 1000000.0
-        assert trade.price == 1.0850
-        assert trade.currency == "EUR"
-        assert trade.venue == "Bloomberg FXGO"
-
-    def test_extract_trade_smart_trade(self) -> None:
-        """Test trade extraction from Smart Trade swap execution report."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(SWAP_MESSAGE)
-
-        handler = SmartTradeHandler()
-        trade = handler.extract_trade(message)
-
-        assert trade.symbol == "USD/JPY"
-        assert trade.side == "Buy"
-        assert trade.quantity == 10000000.0
-        assert trade.price == 148.50
-        assert trade.currency == "USD"
-        assert trade.venue == "Smart Trade (LiquidityFX)"
-        assert trade.settlement_date == "20240117"
-
-    def test_extract_trade_360t(self) -> None:
-        """Test trade extraction from 360T forward execution report."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(FORWARD_MESSAGE)
-
-        handler = ThreeSixtyTHandler()
-        trade = handler.extract_trade(message)
-
-        assert trade.symbol == "EUR/USD"
-        assert trade.side == "Buy"
-        assert trade.quantity == 5000000.0
-        assert trade.price == 1.0900
-        assert trade.currency == "EUR"
-        assert trade.venue == "360T RFS"
-        assert trade.settlement_date == "20240415"
-
-    def test_enhance_message_sets_venue(self) -> None:
+    @pytest.mark.parametrize(
+        "handler, message_fixture, expected",
+        [
+            (
+                _FXGO,
+                "parsed_spot",
+                {
+                    "symbol": "EUR/USD",
+                    "side": "Buy",
+                    "quantity": 1000000.0,
+                    "price": 1.0850,
+                    "currency": "EUR",
+                    "venue": "Bloomberg FXGO",
+                },
+            ),
+            (
+                _SMART_TRADE,
+                "parsed_swap",
+                {
+                    "symbol": "USD/JPY",
+                    "side": "Buy",
+                    "quantity": 10000000.0,
+                    "price": 148.50,
+                    "currency": "USD",
+                    "venue": "Smart Trade (LiquidityFX)",
+                    "settlement_date": "20240117",
+                },
+            ),
+            (
+                _THREE_SIXTY_T,
+                "parsed_forward",
+                {
+                    "symbol": "EUR/USD",
+                    "side": "Buy",
+                    "quantity": 5000000.0,
+                    "price": 1.0900,
+                    "currency": "EUR",
+                    "venue": "360T RFS",
+                    "settlement_date": "20240415",
+                },
+            ),
+        ],
+        ids=["fxgo", "smart_trade", "360t"],
+    )
+    def test_extract_trade(
+        self,
+        request: pytest.FixtureRequest,
+        handler: VenueHandler,
+        message_fixture: str,
+        expected: dict[str, object],
+    ) -> None:
+        """Test trade extraction from each venue's sample execution report."""
+        trade = handler.extract_trade(request.getfixturevalue(message_fixture))
+
+        assert _attrs(trade, expected) == expected
+
+    def test_enhance_message_sets_venue(self, parsed_spot: FixMessage) -> None:
         """Test that enhance_message sets the venue on the message."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(SPOT_MESSAGE_PIPE)
+        message = copy.copy(parsed_spot)
         assert message.venue is None
 
-        handler = FXGOHandler()
-        enhanced = handler.enhance_message(message)
+        enhanced = _FXGO.enhance_message(message)
 
         assert enhanced.venue == "Bloomberg FXGO"
         assert enhanced is message  # Same object, mutated
 
-    def test_enhance_message_smart_trade(self) -> None:
+    def test_enhance_message_smart_trade(self, parsed_swap: FixMessage) -> None:
         """Test enhance_message for Smart Trade venue."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(SWAP_MESSAGE)
-
-        handler = SmartTradeHandler()
-        enhanced = handler.enhance_message(message)
+        enhanced = _SMART_TRADE.enhance_message(copy.copy(parsed_swap))
 
         assert enhanced.venue == "Smart Trade (LiquidityFX)"
 
     def test_bloomberg_dor_handler_properties(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         assert handler.name == "Bloomberg DOR"
         assert "BLOOMBERG_DOR" in handler.sender_comp_ids
         assert "DOR" in handler.sender_comp_ids
 
     def test_bloomberg_dor_matches_sender(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         assert handler.matches_sender("BLOOMBERG_DOR")
         assert handler.matches_sender("bloomberg_dor")
         assert handler.matches_sender("DOR")
@@ -169,17 +185,18 @@ class TestVenueHandlers:
         assert not handler.matches_sender("FXGO")
         assert not handler.matches_sender(None)
 
-    def test_extract_trade_bloomberg_dor(self) -> None:
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        message = parser.parse(BLOOMBERG_DOR_SPOT_EXEC, venue="Bloomberg DOR")
-        handler = BloombergDORHandler()
-        trade = handler.extract_trade(message)
-        assert trade.symbol == "EUR/USD"
-        assert trade.side == "Buy"
-        assert trade.quantity == 1000000.0
-        assert trade.price == 1.08500
-        assert trade.currency == "EUR"
-        assert trade.venue == "Bloomberg DOR"
+    def test_extract_trade_bloomberg_dor(self, shared_parser: FixParser) -> None:
+        message = shared_parser.parse(BLOOMBERG_DOR_SPOT_EXEC, venue="Bloomberg DOR")
+        trade = _BLOOMBERG_DOR.extract_trade(message)
+        expected = {
+            "symbol": "EUR/USD",
+            "side": "Buy",
+            "quantity": 1000000.0,
+            "price": 1.08500,
+            "currency": "EUR",
+            "venue": "Bloomberg DOR",
+        }
+        assert _attrs(trade, expected) == expected
 
 
 class TestVenueRegistry:
@@ -196,7 +213,7 @@ class TestVenueRegistry:
     def test_register_and_get(self) -> None:
         """Test registering and retrieving handlers."""
         registry = VenueRegistry()
-        handler = FXGOHandler()
+        handler = _FXGO
         registry.register(handler)
 
         assert registry.get("Bloomberg FXGO") == handler
@@ -205,8 +222,8 @@ class TestVenueRegistry:
     def test_get_by_sender_id(self) -> None:
         """Test getting handler by SenderCompID."""
         registry = VenueRegistry()
-        registry.register(FXGOHandler())
-        registry.register(SmartTradeHandler())
+        registry.register(_FXGO)
+        registry.register(_SMART_TRADE)
 
         fxgo = registry.get_by_sender_id("FXGO")
         smart_trade = registry.get_by_sender_id("SMARTTRADE")
@@ -214,8 +231,40 @@ class TestVenueRegistry:
         assert smart_trade is not None
         assert fxgo.name == "Bloomberg FXGO"
         assert smart_trade.name == "Smart Trade (LiquidityFX)"
+        assert registry.get_by_sender_id("SmartTrade") is smart_trade
         assert registry.get_by_sender_id("UNKNOWN") is None
 
+    def test_get_by_sender_id_shared_id_prefers_first_registered(self) -> None:
+        """An ID claimed by two venues resolves to the one registered first,
+        and re-registering a venue name swaps in the new handler."""
+
+        class Stub(VenueHandler):
+            def __init__(self, name: str, sender_comp_ids: list[str]) -> None:
+                self._name = name
+                self._ids = sender_comp_ids
+
+            @property
+            def name(self) -> str:
+                return self._name
+
+            @property
+            def sender_comp_ids(self) -> list[str]:
+                return self._ids
+
+        first = Stub("First", ["SHARED", "FIRST"])
+        second = Stub("Second", ["shared", "SECOND"])
+        registry = VenueRegistry()
+        registry.register(first)
+        registry.register(second)
+        assert registry.get_by_sender_id("Shared") is first
+        assert registry.get_by_sender_id("second") is second
+
+        replacement = Stub("first", ["OTHER"])
+        registry.register(replacement)
+        assert registry.get_by_sender_id("SHARED") is second
+        assert registry.get_by_sender_id("OTHER") is replacement
+        assert registry.get_by_sender_id("FIRST") is None
+
     def test_default_registry(self, venue_registry: VenueRegistry) -> None:
         """Test default registry has all handlers."""
         venues = venue_registry.all_venues()
@@ -226,28 +275,37 @@ class TestVenueRegistry:
         assert "360T RFS" in venue_names
         assert "360T TI" in venue_names
 
-    def test_venue_detection_from_message(self, venue_registry: VenueRegistry) -> None:
+    def test_venue_detection_from_message(
+        self,
+        venue_registry: VenueRegistry,
+        parsed_spot: FixMessage,
+        parsed_swap: FixMessage,
+        parsed_forward: FixMessage,
+    ) -> None:
         """Test venue detection from parsed message."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-
         # FXGO message
-        fxgo_msg = parser.parse(SPOT_MESSAGE_PIPE)
-        handler = venue_registry.get_by_sender_id(fxgo_msg.sender_comp_id)
+        handler = venue_registry.get_by_sender_id(parsed_spot.sender_comp_id)
         assert handler is not None
         assert handler.name == "Bloomberg FXGO"
 
         # 360T message
-        msg_360t = parser.parse(FORWARD_MESSAGE)
-        handler = venue_registry.get_by_sender_id(msg_360t.sender_comp_id)
+        handler = venue_registry.get_by_sender_id(parsed_forward.sender_comp_id)
         assert handler is not None
         assert handler.name == "360T RFS"
 
         # Smart Trade message
-        st_msg = parser.parse(SWAP_MESSAGE)
-        handler = venue_registry.get_by_sender_id(st_msg.sender_comp_id)
+        handler = venue_registry.get_by_sender_id(parsed_swap.sender_comp_id)
         assert handler is not None
         assert handler.name == "Smart Trade (LiquidityFX)"
 
+    def test_every_declared_sender_id_matches(self, venue_registry: VenueRegistry) -> None:
+        """Each handler matches all of its own SenderCompIDs in any case."""
+        for handler in venue_registry.all_venues():
+            for sender_id in handler.sender_comp_ids:
+                assert handler.matches_sender(sender_id)
+                assert handler.matches_sender(sender_id.lower())
+            assert not handler.matches_sender("")
+
     def test_default_registry_includes_bloomberg_dor(self, venue_registry: VenueRegistry) -> None:
         venues = venue_registry.all_venues()
         venue_names = [v.name for v in venues]
@@ -265,27 +323,30 @@ class TestVenueRegistry:
         names = [v.name for v in venue_registry.all_venues()]
         assert names.index("360T TI") == names.index("360T RFS") + 1
 
-    def test_venue_detection_bloomberg_dor(self, venue_registry: VenueRegistry) -> None:
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(BLOOMBERG_DOR_SPOT_EXEC)
+    def test_venue_detection_bloomberg_dor(
+        self, shared_parser: FixParser, venue_registry: VenueRegistry
+    ) -> None:
+        msg = shared_parser.parse(BLOOMBERG_DOR_SPOT_EXEC)
         handler = venue_registry.get_by_sender_id(msg.sender_comp_id)
         assert handler is not None
         assert handler.name == "Bloomberg DOR"
 
-    def test_detect_from_message_by_sender(self, venue_registry: VenueRegistry) -> None:
+    def test_detect_from_message_by_sender(
+        self, shared_parser: FixParser, venue_registry: VenueRegistry
+    ) -> None:
         """detect_from_message resolves a venue from SenderCompID (49)."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(BLOOMBERG_DOR_SPOT_EXEC)
+        msg = shared_parser.parse(BLOOMBERG_DOR_SPOT_EXEC)
         handler = venue_registry.detect_from_message(msg)
         assert handler is not None
         assert handler.name == "Bloomberg DOR"
 
-    def test_detect_from_message_by_target(self, venue_registry: VenueRegistry) -> None:
+    def test_detect_from_message_by_target(
+        self, shared_parser: FixParser, venue_registry: VenueRegistry
+    ) -> None:
         """detect_from_message resolves client-to-venue messages via the
         TargetCompID (56) / OnBehalfOfCompID (115) when the sender is the
         client rather than the venue."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(BLOOMBERG_DOR_SPOT_RFQ)
+        msg = shared_parser.parse(BLOOMBERG_DOR_SPOT_RFQ)
 
         # Sender alone does not identify the venue here.
         assert msg.sender_comp_id == "CLIENT"
@@ -296,21 +357,19 @@ class TestVenueRegistry:
         assert handler.name == "Bloomberg DOR"
 
     def test_detect_from_message_returns_none_when_no_match(
-        self, venue_registry: VenueRegistry
+        self, shared_parser: FixParser, venue_registry: VenueRegistry
     ) -> None:
         """detect_from_message returns None when no comp ID matches a venue."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(SIMPLE_MESSAGE)
+        msg = shared_parser.parse(SIMPLE_MESSAGE)
         assert venue_registry.detect_from_message(msg) is None
 
     def test_generic_bloomberg_compid_resolves_to_dor_not_fxgo(
-        self, venue_registry: VenueRegistry
+        self, shared_parser: FixParser, venue_registry: VenueRegistry
     ) -> None:
         """A FIXT.1.1 DOR message with a generic 49=BLOOMBERG is detected as
         Bloomberg DOR via protocol markers — even though that CompID alone
         matches Bloomberg FXGO."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(BLOOMBERG_DOR_GENERIC_COMPID_EXEC)
+        msg = shared_parser.parse(BLOOMBERG_DOR_GENERIC_COMPID_EXEC)
 
         # CompID alone resolves to FXGO:
         fxgo = venue_registry.get_by_sender_id("BLOOMBERG")
@@ -322,12 +381,12 @@ class TestVenueRegistry:
         assert detected is not None
         assert detected.name == "Bloomberg DOR"
 
-    def test_plain_fxgo_message_still_detected(self, venue_registry: VenueRegistry) -> None:
+    def test_plain_fxgo_message_still_detected(
+        self, venue_registry: VenueRegistry, parsed_spot: FixMessage
+    ) -> None:
         """A plain FIX.4.4 Bloomberg FXGO execution is still resolved to
         Bloomberg FXGO — the protocol-aware claims pass must not swallow it."""
-        parser = FixParser(config=ParserConfig(strict_checksum=False))
-        msg = parser.parse(SPOT_MESSAGE_PIPE)
-        detected = venue_registry.detect_from_message(msg)
+        detected = venue_registry.detect_from_message(parsed_spot)
         assert detected is not None
         assert detected.name == "Bloomberg FXGO"
 
@@ -339,34 +398,34 @@ class TestBloombergDORClaimsMessage:
         return FixMessage(fields=[FixField(tag=t, raw_value=v) for t, v in tag_values.items()])
 
     def test_claims_generic_bloomberg_compid_over_fixt11(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIXT.1.1", 35: "8", 49: "BLOOMBERG", 56: "CLIENT"})
         assert handler.claims_message(msg) is True
 
     def test_claims_on_dor_routing_id_115(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIX.4.4", 35: "8", 49: "BLOOMBERG", 115: "DOR"})
         assert handler.claims_message(msg) is True
 
     def test_claims_on_dor_only_msg_type(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIX.4.4", 35: "AI", 49: "BLOOMBERG"})
         assert handler.claims_message(msg) is True
 
     def test_claims_on_appl_ver_id(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIXT.1.1", 35: "S", 49: "BBG", 1128: "9"})
         assert handler.claims_message(msg) is True
 
     def test_does_not_claim_other_venue_fixt11(self) -> None:
         # A FIXT.1.1 / FIX5.0 message from another venue (no Bloomberg CompID)
         # must NOT be claimed by DOR.
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIXT.1.1", 35: "8", 49: "TR MATCHING", 1128: "9"})
         assert handler.claims_message(msg) is False
 
     def test_does_not_claim_plain_fxgo_message(self) -> None:
-        handler = BloombergDORHandler()
+        handler = _BLOOMBERG_DOR
         msg = self._msg({8: "FIX.4.4", 35: "8", 49: "FXGO", 56: "CLIENT"})
         assert handler.claims_message(msg) is False
 
@@ -455,7 +514,7 @@ class TestSymbolFallback:
 
     def _trade(self, tag_values: Mapping[int, str]) -> ParsedTrade:
         msg = FixMessage(fields=[FixField(tag=t, raw_value=v) for t, v in tag_values.items()])
-        return BloombergDORHandler().extract_trade(msg)
+        return _BLOOMBERG_DOR.extract_trade(msg)
 
     def test_uses_tag_55_when_present(self) -> None:
         trade = self._trade({35: "AE", 55: "USDJPY"})